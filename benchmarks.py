@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Бенчмарки для расчета расписания Floating Island
+Запуск: python benchmarks.py [команда]
+"""
+
+import heapq
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+import pytz
+
+from floating_island_bot import (
+    BASE_EVENT_TIME,
+    EVENT_DURATION,
+    EVENT_INTERVAL,
+    NOTIFICATION_ADVANCE,
+    calculate_event_arrays,
+    calculate_next_events,
+    find_notification_window,
+)
+from quick_check import due_event_index
+from timing_wheel import TimingWheel
+from tz_render import LocalTimeRenderer
+
+def measure(func, repeat: int = 1000):
+    """Возвращает среднее время одного вызова func в микросекундах"""
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - started) / repeat * 1_000_000
+
+def legacy_first_event(from_time: datetime):
+    """Старый способ поиска первого события - перебор от BASE_EVENT_TIME"""
+    current_event = BASE_EVENT_TIME
+    while current_event < from_time:
+        current_event += EVENT_INTERVAL
+    return current_event
+
+def benchmark_timeline():
+    """Сравнивает поиск первого события перебором и арифметически для разных лет"""
+    print("⏱️ БЕНЧМАРК: поиск первого события")
+    print("=" * 60)
+    print(f"{'Дата запроса':<20}{'Перебор, мкс':>20}{'O(1), мкс':>20}")
+    print("-" * 60)
+
+    for year in (2025, 2026, 2030, 2035):
+        query_time = datetime(year, 9, 1, 12, 0, 0, tzinfo=pytz.UTC)
+
+        # Проверяем, что оба способа дают одинаковый результат
+        expected = legacy_first_event(query_time)
+        actual = calculate_next_events(query_time, count=1)[0]['event_start']
+        assert expected == actual, f"Расхождение для {query_time}: {expected} != {actual}"
+
+        legacy_us = measure(lambda: legacy_first_event(query_time), repeat=200)
+        closed_us = measure(lambda: calculate_next_events(query_time, count=1))
+        print(f"{query_time.strftime('%d.%m.%Y'):<20}{legacy_us:>20.1f}{closed_us:>20.1f}")
+
+    print("=" * 60)
+
+def legacy_event_dicts(from_time: datetime, count: int):
+    """Старый формат событий - список словарей с готовыми datetime"""
+    events = []
+    current_event = legacy_first_event(from_time)
+    for i in range(count):
+        events.append({
+            'notification_time': current_event - NOTIFICATION_ADVANCE,
+            'event_start': current_event,
+            'event_end': current_event + EVENT_DURATION,
+            'event_number': i + 1
+        })
+        current_event += EVENT_INTERVAL
+    return events
+
+def measure_allocation(func):
+    """Возвращает (время в мс, пиковую память в КБ) для одного вызова func"""
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = func()
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return elapsed_ms, peak / 1024
+
+def benchmark_events():
+    """Сравнивает память и время создания длинного горизонта: словари против Event"""
+    print("⏱️ БЕНЧМАРК: память на длинном горизонте событий")
+    print("=" * 70)
+    print(f"{'Событий':<12}{'dict, мс':>14}{'dict, КБ':>14}{'Event, мс':>14}{'Event, КБ':>14}")
+    print("-" * 70)
+
+    for count in (1_000, 10_000, 100_000):
+        dict_ms, dict_kb = measure_allocation(lambda: legacy_event_dicts(BASE_EVENT_TIME, count))
+        event_ms, event_kb = measure_allocation(lambda: calculate_next_events(BASE_EVENT_TIME, count))
+        print(f"{count:<12}{dict_ms:>14.1f}{dict_kb:>14.0f}{event_ms:>14.1f}{event_kb:>14.0f}")
+
+    print("=" * 70)
+
+def benchmark_bulk():
+    """Сравнивает массовый расчет расписания: чистый Python против NumPy"""
+    try:
+        import numpy  # noqa: F401
+        numpy_available = True
+    except ImportError:
+        numpy_available = False
+
+    print("⏱️ БЕНЧМАРК: массовый расчет расписания")
+    print("=" * 60)
+    if not numpy_available:
+        print("⚠️ NumPy не установлен - измеряем только расчет на чистом Python")
+    print(f"{'Событий':<20}{'Python, мс':>20}{'NumPy, мс':>20}")
+    print("-" * 60)
+
+    for count in (10 ** 3, 10 ** 5, 10 ** 6):
+        python_ms = measure(lambda: calculate_event_arrays(BASE_EVENT_TIME, count, use_numpy=False), repeat=1) / 1000
+        if numpy_available:
+            numpy_ms = measure(lambda: calculate_event_arrays(BASE_EVENT_TIME, count), repeat=1) / 1000
+            numpy_text = f"{numpy_ms:.1f}"
+        else:
+            numpy_text = "-"
+        print(f"{count:<20}{python_ms:>20.1f}{numpy_text:>20}")
+
+    print("=" * 60)
+
+def benchmark_timezone():
+    """Сравнивает перевод времени событий в киевское: pytz astimezone против таблицы переходов"""
+    kiev_tz = pytz.timezone('Europe/Kiev')
+    now = datetime.now(pytz.UTC)
+    events = calculate_next_events(now, count=10_000)
+    event_starts = [event.event_start for event in events]
+    renderer = LocalTimeRenderer('Europe/Kiev', start=now, end=event_starts[-1])
+
+    print("⏱️ БЕНЧМАРК: перевод времени в Europe/Kiev")
+    print("=" * 60)
+    pytz_us = measure(lambda: [t.astimezone(kiev_tz).strftime('%d.%m %H:%M') for t in event_starts], repeat=5)
+    table_us = measure(lambda: [renderer.format(t, '%d.%m %H:%M') for t in event_starts], repeat=5)
+    print(f"📊 Событий: {len(event_starts)}")
+    print(f"🐢 pytz astimezone: {pytz_us / len(event_starts):.2f} мкс на событие")
+    print(f"🚀 Таблица переходов: {table_us / len(event_starts):.2f} мкс на событие")
+    print("=" * 60)
+
+TIMER_HORIZON = 86400  # Таймеры разбросаны по суткам
+TIMER_STEP = 60  # Шаг продвижения времени при срабатывании, сек
+
+def run_wheel_timers(deadlines):
+    """Добавляет таймеры в колесо, отменяет каждый десятый и прогоняет сутки"""
+    wheel = TimingWheel(tick=1.0, start=0)
+
+    started = time.perf_counter()
+    timers = [wheel.schedule(deadline, index) for index, deadline in enumerate(deadlines)]
+    inserted = time.perf_counter()
+    for timer in timers[::10]:
+        timer.cancel()
+    cancelled = time.perf_counter()
+    fired = sum(len(wheel.advance(now)) for now in range(TIMER_STEP, TIMER_HORIZON + TIMER_STEP, TIMER_STEP))
+    drained = time.perf_counter()
+
+    return fired, inserted - started, cancelled - inserted, drained - cancelled
+
+def run_heap_timers(deadlines):
+    """То же на heapq: отмена помечает запись, снятие - при извлечении"""
+    heap = []
+
+    started = time.perf_counter()
+    entries = []
+    for index, deadline in enumerate(deadlines):
+        entry = [deadline, index, True]
+        heapq.heappush(heap, entry)
+        entries.append(entry)
+    inserted = time.perf_counter()
+    for entry in entries[::10]:
+        entry[2] = False
+    cancelled = time.perf_counter()
+    fired = 0
+    for now in range(TIMER_STEP, TIMER_HORIZON + TIMER_STEP, TIMER_STEP):
+        while heap and heap[0][0] <= now:
+            if heapq.heappop(heap)[2]:
+                fired += 1
+    drained = time.perf_counter()
+
+    return fired, inserted - started, cancelled - inserted, drained - cancelled
+
+def benchmark_timers():
+    """Сравнивает колесо таймеров с heapq для 10^3 - 10^6 ожидающих таймеров"""
+    print("⏱️ БЕНЧМАРК: колесо таймеров против heapq")
+    print("=" * 78)
+    print(f"{'Таймеров':<12}{'':<8}{'Вставка, мкс':>18}{'Отмена, мкс':>18}{'Срабатывание, мс':>22}")
+    print("-" * 78)
+
+    generator = random.Random(42)
+    for power in range(3, 7):
+        count = 10 ** power
+        deadlines = [generator.uniform(1, TIMER_HORIZON) for _ in range(count)]
+        cancels = len(deadlines[::10])
+
+        results = {'wheel': run_wheel_timers(deadlines), 'heapq': run_heap_timers(deadlines)}
+        assert results['wheel'][0] == results['heapq'][0], "Колесо и heapq сработали по-разному"
+
+        for name, (fired, insert, cancel, drain) in results.items():
+            label = f"10^{power}" if name == 'wheel' else ''
+            print(f"{label:<12}{name:<8}{insert / count * 1e6:>18.2f}"
+                  f"{cancel / cancels * 1e6:>18.2f}{drain * 1000:>22.1f}")
+
+    print("=" * 78)
+
+STARTUP_RUNS = 10  # Запусков интерпретатора на каждый путь
+
+def measure_startup(args, runs: int = STARTUP_RUNS):
+    """Медиана времени запуска отдельного процесса Python с аргументами args, мс"""
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run([sys.executable] + args, check=True, stdout=subprocess.DEVNULL,
+                       cwd=os.path.dirname(os.path.abspath(__file__)))
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+def benchmark_startup():
+    """Сравнивает холодный запуск быстрой проверки и основного модуля бота"""
+    print("🧊 БЕНЧМАРК: холодный запуск проверки")
+    print("=" * 60)
+
+    # Быстрая проверка не должна пропускать ни одного момента, когда основной путь отправляет
+    base = int(BASE_EVENT_TIME.timestamp())
+    interval = int(EVENT_INTERVAL.total_seconds())
+    missed = 0
+    extra = 0
+    for index in (0, 1, 100, 1000):
+        notification_time = base + index * interval - int(NOTIFICATION_ADVANCE.total_seconds())
+        for now in range(notification_time - 400, notification_time + 400):
+            expected = bool(find_notification_window(datetime.fromtimestamp(now, pytz.UTC)))
+            due = due_event_index(now) is not None
+            missed += expected and not due
+            extra += due and not expected
+    print(f"✅ Пропущено событий: {missed}, лишних запусков основного пути: {extra}")
+
+    idle = str(base + interval // 2)  # Момент посередине между событиями
+    baseline_ms = measure_startup(['-c', 'pass'])
+    quick_ms = measure_startup(['quick_check.py', '--check-only', f'--at={idle}'])
+    full_ms = measure_startup(['-c', 'import floating_island_bot'])
+    print(f"🐍 Пустой интерпретатор: {baseline_ms:.0f} мс")
+    print(f"🚀 quick_check.py (нет события): {quick_ms:.0f} мс")
+    print(f"🐢 import floating_island_bot: {full_ms:.0f} мс")
+    print("=" * 60)
+
+BENCHMARKS = {
+    'timeline': benchmark_timeline,
+    'events': benchmark_events,
+    'bulk': benchmark_bulk,
+    'tz': benchmark_timezone,
+    'timers': benchmark_timers,
+    'startup': benchmark_startup,
+}
+
+def main():
+    """Основная функция с CLI интерфейсом"""
+    if len(sys.argv) > 1:
+        name = sys.argv[1].lower()
+        if name not in BENCHMARKS:
+            print(f"❌ Неизвестный бенчмарк. Доступны: {', '.join(BENCHMARKS)}")
+            return
+        BENCHMARKS[name]()
+        return
+
+    for benchmark in BENCHMARKS.values():
+        benchmark()
+        print()
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Массовые операции с заданиями cron-провайдеров
+Запросы выполняются параллельно в пуле потоков с ограничением параллельности,
+а темп по-прежнему задает лимитер провайдера в http_client
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple
+
+import http_client
+from reconcile import JOB_TITLE_PREFIX, is_notification_job
+
+DEFAULT_CONCURRENCY = int(os.environ.get('SCHEDULE_CONCURRENCY', '4'))  # Одновременных запросов
+
+def run_concurrently(func, items, concurrency: int = DEFAULT_CONCURRENCY):
+    """
+    Вызывает func(item) для каждого элемента не более чем в concurrency потоков
+    Возвращает результаты в порядке items; исключение превращается в результат False
+    """
+    items = list(items)
+
+    def call(item):
+        try:
+            return func(item)
+        except Exception as e:
+            print(f"❌ Исключение при обработке {item}: {e}")
+            return False
+
+    if concurrency <= 1 or len(items) <= 1:
+        return [call(item) for item in items]
+
+    # Пул соединений к хосту должен вмещать все одновременные запросы
+    if http_client.POOL_SIZE < concurrency:
+        http_client.configure(pool_size=concurrency)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return list(executor.map(call, items))
+
+DELETE_RETRIES = 2  # Повторных попыток для неудачных удалений
+
+class BulkDeleteResult(NamedTuple):
+    """Итог массового удаления заданий"""
+    deleted: list  # (job_id, title) удаленных заданий
+    failed: list  # (job_id, title) заданий, которые не удалось удалить
+    skipped: list  # (job_id, title) основных заданий Checker, которые не трогаем
+
+def select_cleanup_jobs(existing_jobs):
+    """
+    Делит задания (пары job_id, title) на одноразовые задания уведомлений для удаления
+    и основные задания Checker, которые нужно оставить
+    """
+    to_delete = []
+    skipped = []
+    for job_id, title in existing_jobs:
+        if not job_id or JOB_TITLE_PREFIX not in title:
+            continue
+        if is_notification_job(title):
+            to_delete.append((job_id, title))
+        else:
+            skipped.append((job_id, title))
+    return to_delete, skipped
+
+def bulk_delete(delete, jobs, concurrency: int = DEFAULT_CONCURRENCY,
+                retries: int = DELETE_RETRIES, skipped=()) -> BulkDeleteResult:
+    """
+    Удаляет задания (пары job_id, title) параллельно через delete(job_id, title) -> bool
+    Повторно отправляются только неудачные удаления
+    """
+    deleted = []
+    pending = list(jobs)
+
+    for attempt in range(retries + 1):
+        if not pending:
+            break
+        if attempt:
+            print(f"🔁 Повторяем удаление {len(pending)} заданий (попытка {attempt + 1}/{retries + 1})")
+
+        results = run_concurrently(lambda job: delete(*job), pending, concurrency)
+        deleted.extend(job for job, ok in zip(pending, results) if ok)
+        pending = [job for job, ok in zip(pending, results) if not ok]
+
+    return BulkDeleteResult(deleted=deleted, failed=pending, skipped=list(skipped))
\ No newline at end of file
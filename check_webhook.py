@@ -2,7 +2,7 @@
 # -*- coding: utf-8 -*-
 
 import os
-import requests
+import http_client
 import json
 from datetime import datetime
 import pytz
@@ -50,7 +50,7 @@ def test_webhook_url(url, token):
     }
     
     try:
-        response = requests.post(url, headers=headers, json=payload, timeout=10)
+        response = http_client.post(url, headers=headers, json=payload, timeout=10)
         
         if response.status_code == 204:
             return True, "Webhook работает корректно"
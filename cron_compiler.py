@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Компилятор повторяющихся cron-расписаний для Floating Island
+События идут строго через 500 минут, поэтому вместо одноразового задания
+на каждое событие можно поставить небольшое число повторяющихся заданий.
+Расписание - декартово произведение минут, часов, дней месяца и месяцев (как в cron),
+компилятор склеивает моменты срабатывания в такие произведения, а верификатор
+перебирает все срабатывания расписаний и сверяет их с моментами событий.
+В cron нет года, поэтому горизонт не может захватить тот же месяц следующего года
+
+Запуск: python cron_compiler.py [дней]
+"""
+
+import sys
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import NamedTuple
+
+import pytz
+
+from dispatch_latency import get_dispatch_lead
+from floating_island_bot import NOTIFICATION_ADVANCE, get_event_index_at_or_after, get_event_start
+
+DEFAULT_HORIZON = timedelta(days=90)
+
+# Поля расписания в порядке cron-выражения
+FIELDS = ('minutes', 'hours', 'mdays', 'months')
+
+class CronSchedule(NamedTuple):
+    """Повторяющееся расписание: срабатывает в каждой комбинации значений полей (UTC)"""
+    minutes: tuple
+    hours: tuple
+    mdays: tuple
+    months: tuple
+
+    def expression(self) -> str:
+        """
+        Стандартное cron-выражение (FastCron)
+        В выражении нет срока действия, а точным расписание проверено только в [start, end)
+        горизонта - задание по нему нужно остановить в конце горизонта
+        (у cron-job.org это делает expiresAt из to_cronjob_schedule)
+        """
+        return ' '.join(format_field(getattr(self, field)) for field in FIELDS) + ' *'
+
+    def to_cronjob_schedule(self, expires_at: datetime = None) -> dict:
+        """Объект schedule для cron-job.org; задание перестает срабатывать после expires_at"""
+        return {
+            'timezone': 'UTC',
+            'expiresAt': int(expires_at.strftime('%Y%m%d%H%M%S')) if expires_at else 0,
+            'hours': list(self.hours),
+            'minutes': list(self.minutes),
+            'mdays': list(self.mdays),
+            'months': list(self.months),
+            'wdays': [-1]  # любой день недели
+        }
+
+    def fire_times(self, start: datetime, end: datetime):
+        """Все моменты срабатывания в [start, end)"""
+        day = start.replace(hour=0, minute=0, second=0, microsecond=0)
+        while day < end:
+            if day.month in self.months and day.day in self.mdays:
+                for hour in self.hours:
+                    for minute in self.minutes:
+                        moment = day.replace(hour=hour, minute=minute)
+                        if start <= moment < end:
+                            yield moment
+            day += timedelta(days=1)
+
+def format_field(values) -> str:
+    """Значения поля cron через запятую; три и более подряд идущих - диапазоном"""
+    parts = []
+    run = []
+    for value in sorted(values):
+        if run and value != run[-1] + 1:
+            parts.append(_format_run(run))
+            run = []
+        run.append(value)
+    if run:
+        parts.append(_format_run(run))
+    return ','.join(parts)
+
+def _format_run(run) -> str:
+    if len(run) >= 3:
+        return f"{run[0]}-{run[-1]}"
+    return ','.join(str(value) for value in run)
+
+def max_horizon_end(start: datetime) -> datetime:
+    """Первое число того же месяца следующего года: дальше расписания начнут повторяться"""
+    return start.replace(year=start.year + 1, day=1, hour=0, minute=0, second=0, microsecond=0)
+
+def timeline_fire_times(start: datetime, end: datetime, lead: timedelta = None):
+    """Моменты срабатывания заданий для уведомлений в [start, end) с упреждением lead"""
+    if lead is None:
+        lead = get_dispatch_lead()
+
+    times = []
+    index = get_event_index_at_or_after(start + NOTIFICATION_ADVANCE + lead)
+    while True:
+        fire_time = get_event_start(index) - NOTIFICATION_ADVANCE - lead
+        if fire_time >= end:
+            return times
+        times.append(fire_time)
+        index += 1
+
+def compile_schedules(fire_times) -> list:
+    """
+    Склеивает моменты срабатывания в расписания-произведения
+    Два расписания, совпадающие во всех полях кроме одного, объединяются
+    по этому полю - объединение остается точным. Склейка повторяется, пока
+    число расписаний уменьшается
+    """
+    schedules = {
+        tuple(frozenset([value]) for value in (moment.minute, moment.hour, moment.day, moment.month))
+        for moment in fire_times
+    }
+
+    merged = True
+    while merged:
+        merged = False
+        # Сначала дни (одно время суток повторяется через 25 дней), потом часы, месяцы и минуты
+        for position in (2, 1, 3, 0):
+            groups = defaultdict(set)
+            for schedule in schedules:
+                rest = schedule[:position] + schedule[position + 1:]
+                groups[rest].add(schedule[position])
+
+            combined = set()
+            for rest, values in groups.items():
+                combined.add(rest[:position] + (frozenset().union(*values),) + rest[position:])
+
+            if len(combined) < len(schedules):
+                merged = True
+            schedules = combined
+
+    result = [CronSchedule(*(tuple(sorted(values)) for values in schedule)) for schedule in schedules]
+    return sorted(result, key=lambda schedule: (schedule.months, schedule.mdays, schedule.hours, schedule.minutes))
+
+class Verification(NamedTuple):
+    """Результат сверки срабатываний расписаний с моментами событий"""
+    missing: list  # Моменты событий, в которые ничего не срабатывает
+    extra: list  # Срабатывания вне моментов событий
+    duplicates: list  # Моменты, в которые срабатывает больше одного расписания
+
+    @property
+    def exact(self) -> bool:
+        return not self.missing and not self.extra and not self.duplicates
+
+def verify_schedules(schedules, fire_times, start: datetime, end: datetime) -> Verification:
+    """Перебирает все срабатывания расписаний в [start, end) и сверяет с fire_times"""
+    expected = set(fire_times)
+    fired = defaultdict(int)
+    for schedule in schedules:
+        for moment in schedule.fire_times(start, end):
+            fired[moment] += 1
+
+    return Verification(
+        missing=sorted(expected - fired.keys()),
+        extra=sorted(moment for moment in fired if moment not in expected),
+        duplicates=sorted(moment for moment, count in fired.items() if count > 1)
+    )
+
+def compile_timeline(start: datetime = None, horizon: timedelta = DEFAULT_HORIZON, lead: timedelta = None):
+    """
+    Компилирует расписания для уведомлений на horizon вперед и проверяет их
+    Возвращает (расписания, конец горизонта, результат проверки)
+    """
+    start = start or datetime.now(pytz.UTC)
+    end = min(start + horizon, max_horizon_end(start))
+    fire_times = timeline_fire_times(start, end, lead)
+    schedules = compile_schedules(fire_times)
+    return schedules, end, verify_schedules(schedules, fire_times, start, end)
+
+def main():
+    """Основная функция с CLI интерфейсом"""
+    horizon = DEFAULT_HORIZON
+    if len(sys.argv) > 1:
+        try:
+            horizon = timedelta(days=int(sys.argv[1]))
+        except ValueError:
+            print("❌ Горизонт должен быть числом дней")
+            return False
+
+    start = datetime.now(pytz.UTC)
+    schedules, end, verification = compile_timeline(start, horizon)
+    events = len(timeline_fire_times(start, end))
+
+    print(f"🧮 Повторяющиеся расписания до {end.strftime('%d.%m.%Y %H:%M')} UTC")
+    print("⚠️ Выражения действительны только до конца горизонта: задания нужно остановить в этот момент")
+    print("=" * 60)
+    for schedule in schedules:
+        print(f"   {schedule.expression()}")
+    print("=" * 60)
+    print(f"📊 Событий: {events}, расписаний: {len(schedules)}")
+
+    if verification.exact:
+        print("✅ Расписания срабатывают точно в моменты событий")
+        return True
+
+    print(f"❌ Пропущено: {len(verification.missing)}, лишних: {len(verification.extra)}, "
+          f"повторов: {len(verification.duplicates)}")
+    return False
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,583 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Единый интерфейс cron-провайдеров (cron-job.org, FastCron)
+Провайдер умеет создавать, получать и удалять задания уведомлений,
+а также выполнять эти операции пачкой. Запросы идут через http_client,
+поэтому пул соединений, лимитер и параллельность общие для всех скриптов
+"""
+
+import json
+import os
+import queue
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import NamedTuple
+
+import pytz
+import requests
+
+import http_client
+from bulk_jobs import DEFAULT_CONCURRENCY, BulkDeleteResult, bulk_delete, run_concurrently
+from dispatch_latency import get_dispatch_time
+from job_store import get_job_store
+from reconcile import JOB_TITLE_PREFIX, nearest_moment, notification_job_title
+
+CREATE_RETRIES = 3  # Попыток создания задания
+
+# Хеджирование: через сколько секунд без ответа запускать следующего провайдера
+# и жесткий предел на весь шаг планирования
+HEDGE_DELAY = float(os.environ.get('SCHEDULE_HEDGE_DELAY', '5'))
+SCHEDULE_DEADLINE = float(os.environ.get('SCHEDULE_DEADLINE', '45'))
+
+class JobRecord(NamedTuple):
+    """Задание Floating Island из списка заданий провайдера"""
+    provider: str  # Ключ провайдера в PROVIDERS
+    job_id: object
+    title: str
+    fire_time: datetime  # Ближайшее срабатывание; None - повторяющееся задание (Checker)
+    enabled: bool
+    job: dict  # Задание в формате API
+
+class CronProvider(ABC):
+    """Базовый класс cron-провайдера; наследники реализуют запросы к своему API"""
+
+    name = ''  # Ключ лимитера в rate_limiter.PROVIDER_LIMITS
+    display_name = ''
+    api_key_env = ''
+
+    # Поля задания в ответе API
+    id_field = 'id'
+    title_field = 'name'
+    list_field = 'data'  # Массив заданий в ответе списка
+
+    # Возможности провайдера
+    supports_batch = False  # API умеет создавать несколько заданий одним запросом
+    supports_update = False  # API умеет менять время существующего задания
+
+    # Квоты (None - ограничение неизвестно или отсутствует)
+    max_jobs = None  # Заданий на аккаунт
+    daily_requests = None  # Запросов к API в сутки
+
+    # Паузы перед повтором после таймаута и исключения, сек
+    timeout_backoff = 2
+    error_backoff = 2
+
+    def __init__(self, api_key: str = None, webhook_url: str = None, github_token: str = None):
+        self.api_key = api_key or os.environ.get(self.api_key_env)
+        self.webhook_url = webhook_url or os.environ.get('WEBHOOK_URL')
+        self.github_token = github_token or os.environ.get('GH_TOKEN')
+
+    def is_configured(self) -> bool:
+        """Заданы ли ключ провайдера, WEBHOOK_URL и GH_TOKEN"""
+        return bool(self.api_key and self.webhook_url and self.github_token)
+
+    def validate_environment(self) -> bool:
+        """Проверяет настройки переменных окружения"""
+        if not self.api_key:
+            print(f"❌ Не установлена переменная {self.api_key_env}")
+            return False
+
+        if not self.webhook_url:
+            print("❌ Не установлена переменная WEBHOOK_URL")
+            return False
+
+        if not self.github_token:
+            print("❌ Не установлена переменная GH_TOKEN")
+            return False
+
+        print("✅ Все переменные окружения настроены")
+        return True
+
+    # Запросы к API, которые реализуют наследники
+
+    @abstractmethod
+    def _request_create(self, notification_time: datetime, title: str, fire_time: datetime) -> requests.Response:
+        """Запрос создания одноразового задания, срабатывающего в fire_time"""
+
+    @abstractmethod
+    def _parse_created(self, response: requests.Response):
+        """Возвращает ID созданного задания или None (с выводом ошибки)"""
+
+    @abstractmethod
+    def _request_list(self) -> requests.Response:
+        """Запрос списка заданий; ответ читается потоком (stream=True)"""
+
+    @abstractmethod
+    def _request_delete(self, job_id) -> requests.Response:
+        """Запрос удаления задания"""
+
+    @abstractmethod
+    def _parse_deleted(self, response: requests.Response, job_id) -> bool:
+        """Удалено ли задание (с выводом ошибки)"""
+
+    def local_job(self, job_id, title: str, fire_time: datetime) -> dict:
+        """Созданное задание в формате списка заданий API (для локального хранилища)"""
+        return {self.id_field: job_id, self.title_field: title}
+
+    def job_fire_time(self, job, now: datetime) -> datetime:
+        """Ближайший к now момент срабатывания одноразового задания; None для повторяющихся"""
+        return None
+
+    def job_enabled(self, job) -> bool:
+        return True
+
+    # Общие операции
+
+    def create_job(self, notification_time: datetime, title: str = None, retry_count: int = CREATE_RETRIES):
+        """Создает одноразовое задание уведомления; возвращает ID задания или False"""
+        if not title:
+            title = notification_job_title(notification_time)
+
+        # Задание срабатывает раньше уведомления на типичную задержку запуска workflow
+        fire_time = get_dispatch_time(notification_time)
+
+        # Паузы при rate limiting задает лимитер провайдера в http_client
+        for attempt in range(retry_count):
+            try:
+                response = self._request_create(notification_time, title, fire_time)
+
+                if response.status_code == 429:
+                    # Лимитер провайдера уже снизил скорость и учел Retry-After,
+                    # следующая попытка сама подождет столько, сколько нужно
+                    print(f"⏳ {self.display_name} rate limit (попытка {attempt + 1}/{retry_count}). "
+                          f"Ждем по лимитеру провайдера...")
+                    continue
+
+                job_id = self._parse_created(response)
+                if not job_id:
+                    return False
+
+                get_job_store().record_created(self.name, job_id, notification_time, title,
+                                               self.local_job(job_id, title, fire_time))
+                print(f"✅ {self.display_name}: задание создано! Job ID: {job_id}")
+                print(f"🕐 Время: {fire_time.strftime('%d.%m.%Y %H:%M')} UTC "
+                      f"(за {(notification_time - fire_time).total_seconds():.0f} сек до уведомления)")
+                return job_id
+
+            except requests.exceptions.Timeout:
+                print(f"⏰ Таймаут запроса (попытка {attempt + 1}/{retry_count})")
+                if attempt < retry_count - 1:
+                    time.sleep(self.timeout_backoff)
+            except Exception as e:
+                print(f"❌ Исключение при создании задания (попытка {attempt + 1}): {e}")
+                if attempt < retry_count - 1:
+                    time.sleep(self.error_backoff)
+                    continue
+                return False
+
+        print(f"❌ Не удалось создать задание {self.display_name} после {retry_count} попыток")
+        return False
+
+    def iter_jobs(self, now: datetime = None, only_floating: bool = True):
+        """
+        Читает список заданий потоком и по мере разбора отдает JobRecord
+        только для заданий Floating Island (only_floating=False - для всех заданий),
+        память не зависит от размера аккаунта
+        Ошибка запроса или разбора поднимается исключением
+        """
+        now = now or datetime.now(pytz.UTC)
+        response = self._request_list()
+        try:
+            if response.status_code != 200:
+                raise requests.HTTPError(f"{self.display_name}: HTTP {response.status_code}", response=response)
+            for job in http_client.iter_json_array(response, self.list_field):
+                title = self.job_title(job)
+                if only_floating and JOB_TITLE_PREFIX not in title:
+                    continue
+                yield JobRecord(self.name, self.job_id(job), title,
+                                self.job_fire_time(job, now), self.job_enabled(job), job)
+        finally:
+            response.close()
+
+    def sync_jobs(self):
+        """
+        Потоково получает список заданий у провайдера и заменяет им локальное хранилище
+        Возвращает задания Floating Island или None при ошибке
+        """
+        store = get_job_store()
+        try:
+            only_local, only_remote = store.replace(
+                self.name, ((record.job_id, record.title, record.job) for record in self.iter_jobs()))
+        except Exception as e:
+            print(f"❌ Ошибка получения списка заданий {self.display_name}: {e}")
+            return None
+
+        if only_local or only_remote:
+            print(f"🔎 {self.display_name}: расхождение с локальным хранилищем - "
+                  f"только локально {only_local}, только у провайдера {only_remote}")
+        return [job.job for job in store.jobs(self.name)]
+
+    def stored_jobs(self, audit: bool = False):
+        """
+        Список заданий из локального хранилища без запроса к API
+        Со списком провайдера сверяется при audit=True, при пустом хранилище
+        и раз в job_store.AUDIT_INTERVAL
+        """
+        store = get_job_store()
+        if audit or store.needs_audit(self.name):
+            return self.sync_jobs()
+        return [job.job for job in store.jobs(self.name)]
+
+    def job_id(self, job):
+        return job.get(self.id_field)
+
+    def job_title(self, job) -> str:
+        return job.get(self.title_field, '')
+
+    def job_pairs(self, jobs):
+        """Пары (job_id, title) для сверки и очистки"""
+        return [(self.job_id(job), self.job_title(job)) for job in jobs]
+
+    def delete_job(self, job_id, title: str = '') -> bool:
+        """Удаляет одно задание по ID"""
+        try:
+            response = self._request_delete(job_id)
+            if response.status_code != 200:
+                print(f"⚠️ Не удалось удалить задание {job_id}: HTTP {response.status_code}")
+                return False
+            if not self._parse_deleted(response, job_id):
+                return False
+            get_job_store().record_deleted(self.name, job_id)
+            print(f"🗑️ Удалено задание: {title} (ID: {job_id})")
+            return True
+        except Exception as e:
+            print(f"⚠️ Исключение при удалении задания {job_id}: {e}")
+            return False
+
+    def create_jobs(self, notification_times, concurrency: int = DEFAULT_CONCURRENCY):
+        """Создает задания для списка времен; ID (или False) в том же порядке"""
+        return run_concurrently(self.create_job, notification_times, concurrency)
+
+    def delete_jobs(self, jobs, concurrency: int = DEFAULT_CONCURRENCY, skipped=()) -> BulkDeleteResult:
+        """Удаляет задания (пары job_id, title), повторяя только неудачные"""
+        return bulk_delete(self.delete_job, jobs, concurrency, skipped=skipped)
+
+    def check_quota(self, existing_jobs: int, to_create: int, requests_planned: int) -> int:
+        """
+        Сверяет план с квотами провайдера
+        Возвращает, сколько заданий можно создать (с предупреждением, если меньше нужного)
+        """
+        if self.daily_requests is not None and requests_planned > self.daily_requests:
+            print(f"⚠️ {self.display_name}: запланировано {requests_planned} запросов, "
+                  f"суточная квота {self.daily_requests}")
+
+        if self.max_jobs is None:
+            return to_create
+
+        allowed = max(0, self.max_jobs - existing_jobs)
+        if allowed < to_create:
+            print(f"⚠️ {self.display_name}: лимит {self.max_jobs} заданий, создадим только {allowed}")
+        return min(allowed, to_create)
+
+class CronJobOrgProvider(CronProvider):
+    """cron-job.org: задание вызывает workflow_dispatch GitHub Actions"""
+
+    name = 'cron-job.org'
+    display_name = 'cron-job.org'
+    api_key_env = 'CRONJOB_API_KEY'
+    base_url = 'https://api.cron-job.org'
+
+    id_field = 'jobId'
+    title_field = 'title'
+    list_field = 'jobs'
+
+    supports_update = True  # PATCH /jobs/<id>
+    daily_requests = 100  # Лимит REST API для бесплатного аккаунта
+
+    timeout_backoff = 10
+    error_backoff = 5
+
+    def _headers(self):
+        return {
+            'Authorization': f'Bearer {self.api_key}',
+            'Content-Type': 'application/json'
+        }
+
+    def build_job(self, notification_time: datetime, title: str, fire_time: datetime = None) -> dict:
+        """Данные одноразового задания в формате cron-job.org (срабатывает в fire_time)"""
+        fire_time = fire_time or notification_time
+        return {
+            'job': {
+                'url': self.webhook_url,
+                'enabled': True,
+                'title': title,
+                'schedule': {
+                    'timezone': 'UTC',
+                    'hours': [fire_time.hour],
+                    'minutes': [fire_time.minute],
+                    'mdays': [fire_time.day],
+                    'months': [fire_time.month],
+                    'wdays': [-1]  # любой день недели
+                },
+                'requestMethod': 1,  # POST
+                'requestHeaders': [
+                    {
+                        'name': 'Authorization',
+                        'value': f'token {self.github_token}'
+                    },
+                    {
+                        'name': 'Accept',
+                        'value': 'application/vnd.github.v3+json'
+                    },
+                    {
+                        'name': 'Content-Type',
+                        'value': 'application/json'
+                    }
+                ],
+                'requestBody': json.dumps({
+                    'ref': 'main',
+                    'inputs': {
+                        'action': 'notify'
+                    }
+                })
+            }
+        }
+
+    def local_job(self, job_id, title, fire_time):
+        return {'jobId': job_id, 'title': title, 'enabled': True,
+                'schedule': self.build_job(fire_time, title)['job']['schedule']}
+
+    def job_fire_time(self, job, now):
+        schedule = job.get('schedule') or {}
+        values = [schedule.get(field) or [] for field in ('months', 'mdays', 'hours', 'minutes')]
+        # Одноразовое задание - ровно одно значение в каждом поле (-1 - "любое")
+        if not all(len(value) == 1 and value[0] >= 0 for value in values):
+            return None
+        return nearest_moment(now, *(value[0] for value in values))
+
+    def job_enabled(self, job):
+        return job.get('enabled', False)
+
+    def _request_create(self, notification_time, title, fire_time):
+        return http_client.put(f"{self.base_url}/jobs", headers=self._headers(),
+                               json=self.build_job(notification_time, title, fire_time), timeout=30)
+
+    def _parse_created(self, response):
+        if response.status_code in [200, 201]:
+            return response.json().get('jobId')
+        if response.status_code == 401:
+            print("❌ Ошибка аутентификации cron-job.org. Проверьте API ключ")
+        elif response.status_code == 400:
+            print(f"❌ Некорректные данные запроса: {response.text}")
+        else:
+            print(f"❌ Ошибка создания задания: {response.status_code}")
+            print(f"Ответ: {response.text}")
+        return None
+
+    def _request_list(self):
+        return http_client.get(f"{self.base_url}/jobs", headers=self._headers(), timeout=30, stream=True)
+
+    def _request_delete(self, job_id):
+        return http_client.delete(f"{self.base_url}/jobs/{job_id}", headers=self._headers(), timeout=30)
+
+    def _parse_deleted(self, response, job_id):
+        return True
+
+class FastCronProvider(CronProvider):
+    """FastCron: стандартные cron-выражения, более мягкие лимиты"""
+
+    name = 'fastcron'
+    display_name = 'FastCron'
+    api_key_env = 'FASTCRON_API_KEY'
+    base_url = 'https://app.fastcron.com/api'
+
+    id_field = 'id'
+    title_field = 'name'
+
+    supports_update = True  # /v1/cron_edit
+
+    def build_job(self, notification_time: datetime, title: str, fire_time: datetime = None) -> dict:
+        """Параметры одноразового задания для /v1/cron_add (срабатывает в fire_time)"""
+        fire_time = fire_time or notification_time
+        # Подготавливаем POST данные для GitHub webhook
+        post_data = json.dumps({
+            'event_type': 'floating_island_notification',
+            'client_payload': {
+                'notification_time': notification_time.isoformat(),
+                'precision': 'exact'
+            },
+            'ref': 'main'
+        })
+
+        # HTTP заголовки для GitHub API
+        http_headers = (f"Authorization: token {self.github_token}\\r\\n"
+                        f"Accept: application/vnd.github.v3+json\\r\\nContent-Type: application/json")
+
+        return {
+            'token': self.api_key,
+            'name': title,
+            'expression': self.cron_expression(fire_time),
+            'url': self.webhook_url,
+            'httpMethod': 'POST',
+            'postData': post_data,
+            'httpHeaders': http_headers,
+            'timezone': 'UTC',
+            'notify': 'false'  # Отключаем уведомления о сбоях
+        }
+
+    @staticmethod
+    def cron_expression(notification_time: datetime) -> str:
+        return f"{notification_time.minute} {notification_time.hour} {notification_time.day} {notification_time.month} *"
+
+    def local_job(self, job_id, title, fire_time):
+        return {'id': job_id, 'name': title, 'status': 1, 'expression': self.cron_expression(fire_time)}
+
+    def job_fire_time(self, job, now):
+        fields = (job.get('expression') or '').split()
+        # Одноразовое задание - числа в полях минут, часов, дня и месяца
+        if len(fields) != 5 or not all(field.isdigit() for field in fields[:4]):
+            return None
+        minute, hour, day, month = (int(field) for field in fields[:4])
+        return nearest_moment(now, month, day, hour, minute)
+
+    def job_enabled(self, job):
+        return job.get('status') == 1
+
+    def _request_create(self, notification_time, title, fire_time):
+        return http_client.post(f"{self.base_url}/v1/cron_add",
+                                json=self.build_job(notification_time, title, fire_time), timeout=30)
+
+    def _parse_created(self, response):
+        if response.status_code != 200:
+            print(f"❌ Ошибка HTTP {response.status_code}: {response.text}")
+            return None
+        result = response.json()
+        if result.get('status') != 'success':
+            print(f"❌ Ошибка FastCron: {result.get('message', 'Неизвестная ошибка')}")
+            return None
+        return result.get('data', {}).get('id')
+
+    def _request_list(self):
+        return http_client.get(f"{self.base_url}/v1/cron_list", params={'token': self.api_key},
+                               timeout=30, stream=True)
+
+    def _request_delete(self, job_id):
+        return http_client.get(f"{self.base_url}/v1/cron_delete",
+                               params={'token': self.api_key, 'id': job_id}, timeout=30)
+
+    def _parse_deleted(self, response, job_id):
+        result = response.json()
+        if result.get('status') != 'success':
+            print(f"⚠️ Не удалось удалить задание {job_id}: {result.get('message', 'Неизвестная ошибка')}")
+            return False
+        return True
+
+PROVIDERS = {
+    provider.name: provider
+    for provider in (FastCronProvider, CronJobOrgProvider)
+}
+
+def get_provider(name: str) -> CronProvider:
+    """Создает провайдер по имени ('fastcron' или 'cron-job.org')"""
+    return PROVIDERS[name]()
+
+def get_configured_providers():
+    """Провайдеры с заданными ключами в порядке предпочтения (сначала FastCron)"""
+    providers = [provider_class() for provider_class in PROVIDERS.values()]
+    return [provider for provider in providers if provider.is_configured()]
+
+class HedgedResult(NamedTuple):
+    """Итог хеджированного создания задания"""
+    provider: CronProvider  # Провайдер, создавший задание (None - никто не успел)
+    job_id: object
+    elapsed: float  # Секунд до результата
+
+def hedged_create(providers, notification_time: datetime, title: str = None,
+                  hedge_delay: float = HEDGE_DELAY, deadline: float = SCHEDULE_DEADLINE) -> HedgedResult:
+    """
+    Создает задание у первого провайдера; если он не ответил за hedge_delay секунд
+    (или ответил ошибкой), параллельно запускает следующего.
+    Побеждает первый успешный ответ, задания опоздавших провайдеров удаляются:
+    после выбора победителя оставшиеся попытки дожидаются (не дольше deadline),
+    иначе процесс завершится раньше, чем они удалят свой дубликат.
+    Через deadline секунд шаг завершается, даже если запросы еще идут: попытки
+    выполняются в фоновых потоках и не задерживают завершение процесса
+    """
+    started = time.monotonic()
+    pending = list(providers)
+    if not pending:
+        return HedgedResult(None, None, 0.0)
+
+    lock = threading.Lock()
+    state = {'winner': None, 'closed': False}
+    finished = queue.Queue()
+
+    def attempt(provider):
+        try:
+            job_id = provider.create_job(notification_time, title)
+        except Exception as e:
+            print(f"❌ {provider.display_name}: исключение при создании задания: {e}")
+            return False
+        if not job_id:
+            return False
+
+        with lock:
+            is_duplicate = state['winner'] is not None
+            if not is_duplicate:
+                if state['closed']:
+                    # Шаг уже завершился без победителя - единственное задание оставляем
+                    print(f"⚠️ {provider.display_name}: задание {job_id} создано после предела, оставляем его")
+                state['winner'] = (provider, job_id)
+        if is_duplicate:
+            # Задание уже создано другим провайдером - убираем дубликат
+            print(f"🧹 {provider.display_name}: удаляем лишнее задание {job_id}")
+            provider.delete_job(job_id, title or notification_job_title(notification_time))
+        return job_id
+
+    def launch(provider):
+        thread = threading.Thread(target=lambda: finished.put(attempt(provider)), daemon=True)
+        thread.start()
+
+    launch(pending.pop(0))
+    running = 1
+
+    while True:
+        remaining = deadline - (time.monotonic() - started)
+        if remaining <= 0:
+            print(f"⏰ Превышен общий предел планирования {deadline:g} сек")
+            break
+
+        timeout = min(hedge_delay, remaining) if pending else remaining
+        try:
+            finished.get(timeout=timeout)
+            running -= 1
+            failed = True
+        except queue.Empty:
+            failed = False
+
+        with lock:
+            if state['winner']:
+                break
+
+        if pending:
+            provider = pending.pop(0)
+            reason = "ошибка" if failed else f"нет ответа за {hedge_delay:g} сек"
+            print(f"🔀 {reason}, параллельно запускаем {provider.display_name}")
+            launch(provider)
+            running += 1
+        elif not running:
+            break
+
+    with lock:
+        state['closed'] = True
+        winner = state['winner']
+
+    elapsed = time.monotonic() - started
+    if not winner:
+        return HedgedResult(None, None, elapsed)
+
+    # Опоздавшие попытки удаляют свои дубликаты - ждем их до общего предела
+    while running:
+        remaining = deadline - (time.monotonic() - started)
+        try:
+            finished.get(timeout=max(remaining, 0))
+            running -= 1
+        except queue.Empty:
+            print(f"⚠️ Не дождались {running} попыток до предела {deadline:g} сек, "
+                  f"их задания могут остаться дубликатами")
+            break
+    return HedgedResult(winner[0], winner[1], elapsed)
\ No newline at end of file
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Компенсация задержки запуска GitHub Actions
+Между срабатыванием cron-задания и запуском бота проходят очередь runner'а,
+checkout, setup-python и pip install. Бот замеряет эту задержку при каждом запуске,
+а планировщики ставят задания раньше на ее p95, после чего бот
+дожидается начала события и отправляет уведомление точно вовремя
+"""
+
+import json
+import math
+import os
+from datetime import datetime, timedelta
+
+import pytz
+
+import http_client
+
+DISPATCH_LATENCY_FILE = os.environ.get('DISPATCH_LATENCY_FILE', 'dispatch_latency.json')
+DISPATCH_PERCENTILE = 95  # По какому перцентилю задержки выбирать упреждение
+HISTORY_SIZE = 50  # Сколько последних замеров хранить
+MIN_SAMPLES = 5  # Меньше замеров - используем DEFAULT_LEAD
+DEFAULT_LEAD = timedelta(minutes=1)
+# Запуск раньше события должен попадать в окно допуска проверки бота (±5 минут)
+MAX_LEAD = timedelta(minutes=4)
+
+class LatencyHistory:
+    """Последние замеры задержки запуска (секунды) в JSON-файле"""
+
+    def __init__(self, path: str = DISPATCH_LATENCY_FILE, size: int = HISTORY_SIZE):
+        self.path = path
+        self.size = size
+        self.samples = []
+
+    def load(self) -> bool:
+        if not self.path or not os.path.exists(self.path):
+            return False
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.samples = [float(sample) for sample in json.load(f)][-self.size:]
+        except (OSError, ValueError, TypeError) as e:
+            print(f"⚠️ Не удалось прочитать замеры задержки {self.path}: {e}")
+            return False
+        return True
+
+    def save(self) -> bool:
+        if not self.path:
+            return False
+        try:
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump(self.samples[-self.size:], f)
+        except OSError as e:
+            print(f"⚠️ Не удалось сохранить замеры задержки {self.path}: {e}")
+            return False
+        return True
+
+    def record(self, seconds: float):
+        self.samples.append(round(seconds, 3))
+        del self.samples[:-self.size]
+
+    def percentile(self, percent: float) -> float:
+        """Перцентиль по ближайшему рангу; None без замеров"""
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        rank = max(1, math.ceil(percent / 100 * len(ordered)))
+        return ordered[rank - 1]
+
+_dispatch_lead = None
+
+def get_dispatch_lead() -> timedelta:
+    """
+    Насколько раньше события ставить cron-задание: p95 задержки запуска,
+    округленный вверх до минуты (точность расписания провайдеров), не больше MAX_LEAD
+    """
+    global _dispatch_lead
+    if _dispatch_lead is None:
+        history = LatencyHistory()
+        history.load()
+        if len(history.samples) < MIN_SAMPLES:
+            _dispatch_lead = DEFAULT_LEAD
+        else:
+            latency = history.percentile(DISPATCH_PERCENTILE)
+            _dispatch_lead = min(timedelta(minutes=math.ceil(latency / 60)), MAX_LEAD)
+    return _dispatch_lead
+
+def get_dispatch_time(notification_time: datetime, now: datetime = None) -> datetime:
+    """Момент срабатывания cron-задания для уведомления в notification_time"""
+    now = now or datetime.now(pytz.UTC)
+    dispatch_time = notification_time - get_dispatch_lead()
+    if dispatch_time <= now:
+        # Упреждение уже не помещается - ближайшая минута, но не позже уведомления
+        dispatch_time = min(notification_time, (now + timedelta(minutes=1)).replace(second=0, microsecond=0))
+    return dispatch_time
+
+def measure_dispatch_latency(started_at: datetime) -> float:
+    """
+    Задержка от создания запуска workflow до started_at (секунды)
+    Время создания берется из GitHub API; None вне GitHub Actions или при ошибке
+    """
+    run_id = os.environ.get('GITHUB_RUN_ID')
+    repository = os.environ.get('GITHUB_REPOSITORY')
+    token = os.environ.get('GH_TOKEN') or os.environ.get('GITHUB_TOKEN')
+    if not run_id or not repository or not token:
+        return None
+
+    try:
+        response = http_client.get(
+            f"https://api.github.com/repos/{repository}/actions/runs/{run_id}",
+            headers={'Authorization': f'token {token}', 'Accept': 'application/vnd.github.v3+json'},
+            timeout=10
+        )
+        if response.status_code != 200:
+            print(f"⚠️ Не удалось получить запуск workflow: {response.status_code}")
+            return None
+        created_at = datetime.fromisoformat(response.json()['created_at'].replace('Z', '+00:00'))
+    except Exception as e:
+        print(f"⚠️ Ошибка замера задержки запуска: {e}")
+        return None
+
+    return (started_at - created_at).total_seconds()
+
+def record_dispatch_latency(started_at: datetime) -> float:
+    """Замеряет задержку запуска и добавляет ее в историю"""
+    latency = measure_dispatch_latency(started_at)
+    if latency is None or latency < 0:
+        return None
+
+    history = LatencyHistory()
+    history.load()
+    history.record(latency)
+    history.save()
+    print(f"📏 Задержка запуска workflow: {latency:.1f} сек "
+          f"(p{DISPATCH_PERCENTILE} по {len(history.samples)} замерам: "
+          f"{history.percentile(DISPATCH_PERCENTILE):.1f} сек)")
+    return latency
\ No newline at end of file
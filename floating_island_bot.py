@@ -3,11 +3,18 @@
 
 import os
 import sys
-import requests
+import http_client
 import json
+import time
 from datetime import datetime, timedelta
+from itertools import islice
+from typing import NamedTuple
 import pytz
 
+from dispatch_latency import record_dispatch_latency
+from message_cache import MessageCache
+from tz_render import get_renderer
+
 # Константы для Telegram бота
 BOT_TOKEN = os.environ.get('TELEGRAM_BOT_TOKEN')
 CHAT_ID = os.environ.get('TELEGRAM_CHAT_ID')
@@ -18,6 +25,17 @@ BASE_EVENT_TIME = datetime(2025, 8, 19, 16, 0, 0, tzinfo=pytz.UTC)
 EVENT_INTERVAL = timedelta(hours=8, minutes=20)  # Интервал между событиями
 NOTIFICATION_ADVANCE = timedelta(minutes=0)  # Уведомление в момент появления острова
 EVENT_DURATION = timedelta(minutes=30)  # Продолжительность события
+NOTIFICATION_TOLERANCE = timedelta(minutes=5)  # Допуск времени запуска проверки
+# Индекс последнего отправленного события: защита от повторной отправки одного события
+NOTIFY_STATE_FILE = os.environ.get('NOTIFY_STATE_FILE', 'notify_state.json')
+PREWARM_LEAD = timedelta(seconds=5)  # За сколько до отправки прогреваем соединение с Telegram
+# Скользящее окно: сколько ближайших уведомлений держать запланированными (0 - только следующее)
+ROLLING_WINDOW = int(os.environ.get('ROLLING_WINDOW') or '0')
+
+# Настройки текстов уведомлений
+MESSAGE_TIMEZONE = 'Europe/Kiev'  # Время в сообщениях показываем по Киеву (UTC+2/+3)
+MESSAGE_PREFILL_COUNT = 10  # Сколько сообщений готовим заранее
+MESSAGE_CACHE_FILE = os.environ.get('MESSAGE_CACHE_FILE')  # Необязательный файл кэша между запусками
 
 # Настройки для webhook
 WEBHOOK_URL = os.environ.get('WEBHOOK_URL')
@@ -76,15 +94,19 @@ def send_telegram_message(message: str, parse_mode: str = 'HTML'):
     }
     
     try:
-        response = requests.post(url, json=payload, timeout=15)
+        warm = http_client.is_warm(url)
+        started = time.perf_counter()
+        response = http_client.post(url, json=payload, timeout=15)
+        elapsed_ms = (time.perf_counter() - started) * 1000
         
         if response.status_code == 200:
             print(f"✅ Уведомление отправлено успешно")
+            print(f"📶 Отправка за {elapsed_ms:.0f} мс ({'теплое' if warm else 'холодное'} соединение)")
             return True
         elif response.status_code == 400:
             # Попробуем без форматирования
             payload['parse_mode'] = None
-            response = requests.post(url, json=payload, timeout=15)
+            response = http_client.post(url, json=payload, timeout=15)
             if response.status_code == 200:
                 print(f"✅ Уведомление отправлено успешно (без форматирования)")
                 return True
@@ -99,57 +121,233 @@ def send_telegram_message(message: str, parse_mode: str = 'HTML'):
         print(f"❌ Исключение при отправке: {e}")
         return False
 
-def calculate_next_events(from_time: datetime, count: int = 10):
-    """Рассчитывает следующие события Floating Island"""
-    events = []
+def get_event_index_at_or_after(from_time: datetime) -> int:
+    """Возвращает индекс первого события, начинающегося не раньше from_time (за O(1))"""
+    # Деление с округлением вверх: -(-a // b). Для времени до BASE_EVENT_TIME - индекс 0
+    index = -((BASE_EVENT_TIME - from_time) // EVENT_INTERVAL)
+    return max(index, 0)
+
+def get_event_start(index: int) -> datetime:
+    """Возвращает время начала события по его индексу от BASE_EVENT_TIME"""
+    return BASE_EVENT_TIME + EVENT_INTERVAL * index
+
+class Event:
+    """
+    Компактная запись события Floating Island
+    Хранит только индекс события, остальные поля вычисляются по требованию.
+    Поддерживает доступ как к словарю (event['event_start']) для старого кода
+    """
+    __slots__ = ('index', 'event_number')
+    
+    FIELDS = ('notification_time', 'event_start', 'event_end', 'event_number')
+    
+    def __init__(self, index: int, event_number: int = 1):
+        self.index = index
+        self.event_number = event_number
+    
+    @property
+    def event_start(self) -> datetime:
+        return get_event_start(self.index)
+    
+    @property
+    def event_end(self) -> datetime:
+        return self.event_start + EVENT_DURATION
+    
+    @property
+    def notification_time(self) -> datetime:
+        # Уведомление в момент начала события
+        return self.event_start - NOTIFICATION_ADVANCE
     
-    # Находим первое событие после заданного времени
-    current_event = BASE_EVENT_TIME
-    while current_event < from_time:
-        current_event += EVENT_INTERVAL
+    def __getitem__(self, key):
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
     
-    # Генерируем список событий
-    for i in range(count):
-        event_start = current_event
-        event_end = event_start + EVENT_DURATION
-        # Уведомление в момент начала события
-        notification_time = event_start - NOTIFICATION_ADVANCE
-        
-        events.append({
-            'notification_time': notification_time,
-            'event_start': event_start,
-            'event_end': event_end,
-            'event_number': i + 1
-        })
-        
-        current_event += EVENT_INTERVAL
+    def __contains__(self, key):
+        return key in self.FIELDS
     
-    return events
+    def get(self, key, default=None):
+        return self[key] if key in self.FIELDS else default
+    
+    def keys(self):
+        return self.FIELDS
+    
+    def to_dict(self):
+        """Возвращает событие в старом формате словаря"""
+        return {key: self[key] for key in self.FIELDS}
+    
+    def __eq__(self, other):
+        if isinstance(other, Event):
+            return self.index == other.index
+        return NotImplemented
+    
+    def __hash__(self):
+        return hash(self.index)
+    
+    def __repr__(self):
+        return f"Event(index={self.index}, event_start={self.event_start.isoformat()})"
+
+def iter_events(from_time: datetime):
+    """Лениво генерирует события Floating Island, начиная с первого не раньше from_time"""
+    index = get_event_index_at_or_after(from_time)
+    event_number = 1
+    
+    while True:
+        yield Event(index, event_number)
+        index += 1
+        event_number += 1
+
+def calculate_next_events(from_time: datetime, count: int = 10):
+    """Рассчитывает следующие события Floating Island"""
+    return list(islice(iter_events(from_time), count))
 
-def get_current_notification_event():
-    """Получает событие, уведомление о котором должно быть отправлено сейчас (в пределах ±2 минут)"""
-    now = datetime.now(pytz.UTC)
-    tolerance = timedelta(minutes=5)  # Допуск ±5 минут
+def calculate_event_arrays(from_time: datetime, count: int, use_numpy: bool = True):
+    """
+    Рассчитывает сразу count событий для длинных горизонтов (экспорт, планирование)
+    С NumPy возвращает массивы datetime64[s] (UTC), без NumPy - списки datetime.
+    Результат: словарь с ключами event_start, event_end, notification_time
+    """
+    first_index = get_event_index_at_or_after(from_time)
+    
+    np = None
+    if use_numpy:
+        try:
+            import numpy as np
+        except ImportError:
+            print("📝 NumPy недоступен, используем расчет на чистом Python")
+    
+    if np is None:
+        event_starts = [get_event_start(index) for index in range(first_index, first_index + count)]
+        return {
+            'event_start': event_starts,
+            'event_end': [event_start + EVENT_DURATION for event_start in event_starts],
+            'notification_time': [event_start - NOTIFICATION_ADVANCE for event_start in event_starts]
+        }
+    
+    # datetime64 не хранит часовой пояс, все значения - в UTC
+    base = np.datetime64(BASE_EVENT_TIME.replace(tzinfo=None), 's')
+    interval = np.timedelta64(int(EVENT_INTERVAL.total_seconds()), 's')
+    indexes = np.arange(first_index, first_index + count, dtype=np.int64)
+    
+    event_starts = base + indexes * interval
+    return {
+        'event_start': event_starts,
+        'event_end': event_starts + np.timedelta64(int(EVENT_DURATION.total_seconds()), 's'),
+        'notification_time': event_starts - np.timedelta64(int(NOTIFICATION_ADVANCE.total_seconds()), 's')
+    }
+
+class NotificationMatch(NamedTuple):
+    """Событие, время уведомления которого попало в окно проверки"""
+    event: Event
+    offset_seconds: float  # now - notification_time: > 0 - опаздываем, < 0 - рано
+    already_notified: bool  # Уведомление о событии уже отправлено (по сохраненному состоянию)
+
+def load_last_sent(path: str = NOTIFY_STATE_FILE):
+    """Индекс последнего отправленного события или None"""
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return int(json.load(f)['last_sent'])
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        print(f"⚠️ Не удалось прочитать состояние уведомлений {path}: {e}")
+        return None
+
+def save_last_sent(index: int, path: str = NOTIFY_STATE_FILE):
+    """Сохраняет индекс последнего отправленного события"""
+    if not path:
+        return
+    try:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'last_sent': index}, f)
+    except OSError as e:
+        print(f"⚠️ Не удалось сохранить состояние уведомлений {path}: {e}")
+
+def find_notification_window(now: datetime, tolerance: timedelta = NOTIFICATION_TOLERANCE,
+                             last_sent: int = None):
+    """
+    Возвращает события, время уведомления которых попадает в [now - tolerance, now + tolerance]
+    Индексы вычисляются напрямую, без построения и перебора списка событий.
+    last_sent - индекс последнего отправленного события (None - неизвестен)
+    """
+    # notification_time(i) = BASE_EVENT_TIME + i * EVENT_INTERVAL - NOTIFICATION_ADVANCE
+    first_index = get_event_index_at_or_after(now - tolerance + NOTIFICATION_ADVANCE)
+    last_index = (now + tolerance + NOTIFICATION_ADVANCE - BASE_EVENT_TIME) // EVENT_INTERVAL
+    
+    matches = []
+    for index in range(first_index, last_index + 1):
+        event = Event(index)
+        notification_time = event.notification_time
+        matches.append(NotificationMatch(
+            event=event,
+            offset_seconds=(now - notification_time).total_seconds(),
+            already_notified=last_sent is not None and index <= last_sent
+        ))
+    
+    # Ближайшее к текущему моменту событие - первым
+    matches.sort(key=lambda match: abs(match.offset_seconds))
+    return matches
+
+class TimelineSnapshot:
+    """
+    Снимок расписания на один запуск бота с зафиксированным временем now
+    Все функции одного запуска работают с одним снимком, поэтому расписание
+    не пересчитывается повторно, а проверка, сообщение и планирование
+    следующего задания видят одно и то же время
+    """
+    
+    def __init__(self, now: datetime = None, tolerance: timedelta = NOTIFICATION_TOLERANCE,
+                 last_sent: int = None):
+        self.now = now or datetime.now(pytz.UTC)
+        self.tolerance = tolerance
+        self.last_sent = last_sent
+        self._matches = None
+        self._next_event = None
+    
+    @property
+    def matches(self):
+        """События в окне проверки вокруг now (вычисляются один раз)"""
+        if self._matches is None:
+            self._matches = find_notification_window(self.now, self.tolerance, self.last_sent)
+        return self._matches
+    
+    @property
+    def next_event(self) -> Event:
+        """Первое событие с уведомлением строго после now"""
+        if self._next_event is None:
+            event = Event(get_event_index_at_or_after(self.now + NOTIFICATION_ADVANCE))
+            if event.notification_time <= self.now:
+                event = Event(event.index + 1)
+            self._next_event = event
+        return self._next_event
+    
+    def upcoming(self, count: int):
+        """Ближайшие count событий, начиная с now"""
+        return list(islice(iter_events(self.now), count))
+
+def get_current_notification_event(snapshot: TimelineSnapshot = None):
+    """Получает событие, уведомление о котором должно быть отправлено сейчас (в пределах ±5 минут)"""
+    snapshot = snapshot or TimelineSnapshot()
+    now = snapshot.now
+    tolerance = snapshot.tolerance
     
     print(f"🔍 Проверяем время появления острова: {now.strftime('%Y-%m-%d %H:%M:%S')} UTC")
     
-    # Получаем события на ближайшие дни
-    events = calculate_next_events(now - timedelta(days=1), count=100)
-    
-    for event in events:
-        notification_time = event['notification_time']
-        time_diff = abs((now - notification_time).total_seconds())
+    for match in snapshot.matches:
+        event = match.event
+        if match.already_notified:
+            print(f"⏭️ Уведомление о событии {event.event_start.strftime('%d.%m.%Y %H:%M')} UTC уже отправлено")
+            continue
         
-        if time_diff <= tolerance.total_seconds():
-            print(f"✅ Найдено событие для уведомления: разница {time_diff:.0f} секунд")
-            print(f"📅 Уведомление: {notification_time.strftime('%d.%m.%Y %H:%M')} UTC")
-            print(f"🎈 Событие: {event['event_start'].strftime('%d.%m.%Y %H:%M')} UTC")
-            return event
+        print(f"✅ Найдено событие для уведомления: разница {match.offset_seconds:+.0f} секунд")
+        print(f"📅 Уведомление: {event.notification_time.strftime('%d.%m.%Y %H:%M')} UTC")
+        print(f"🎈 Событие: {event.event_start.strftime('%d.%m.%Y %H:%M')} UTC")
+        return event
     
     print(f"❌ Не найдено событий для уведомления (допуск ±{tolerance.total_seconds():.0f} секунд)")
     
     # Показываем ближайшие уведомления для отладки
-    next_event = get_next_notification_event()
+    next_event = get_next_notification_event(snapshot)
     if next_event:
         nt = next_event['notification_time']
         et = next_event['event_start']
@@ -160,56 +358,79 @@ def get_current_notification_event():
     
     return None
 
-def get_next_notification_event():
+def get_next_notification_event(snapshot: TimelineSnapshot = None):
     """Получает следующее событие для планирования"""
-    now = datetime.now(pytz.UTC)
-    events = calculate_next_events(now, count=10)
-    
-    for event in events:
-        if event['notification_time'] > now:
-            return event
-    
-    return None
+    snapshot = snapshot or TimelineSnapshot()
+    return snapshot.next_event
 
-def format_notification_message(event):
-    """Форматирует сообщение для уведомления в момент появления острова"""
-    # Получаем время события
-    event_start = event['event_start']
-    event_end = event['event_end']
-    
-    # Конвертируем в киевское время (UTC+2/+3)
-    kiev_tz = pytz.timezone('Europe/Kiev')
-    event_start_kiev = event_start.astimezone(kiev_tz)
-    event_end_kiev = event_end.astimezone(kiev_tz)
-    
-    # Получаем следующее событие
-    now = datetime.now(pytz.UTC)
-    next_events = calculate_next_events(now, count=5)
-    
-    next_event = None
-    for next_ev in next_events:
-        if next_ev['event_start'] > event['event_start']:
-            next_event = next_ev
-            break
+def get_event_after(event: Event, snapshot: TimelineSnapshot = None) -> Event:
+    """
+    Событие, которое планируется после отправленного event
+    Запуск начинается раньше события на задержку workflow, поэтому снимок,
+    взятый до отправки, еще считает event следующим
+    """
+    snapshot = snapshot or TimelineSnapshot()
+    return Event(max(event.index + 1, snapshot.next_event.index))
+
+def render_notification_message(index: int, zone: str = MESSAGE_TIMEZONE) -> str:
+    """Рендерит текст уведомления для события с индексом index"""
+    # Следующее прибытие - следующее событие расписания
+    next_start = get_event_start(index + 1)
     
     # Новый формат уведомления
     message = f"ЕБУЧИЙ ШАР прибыл!\n"
+    message += f"Следующие прибытие: {get_renderer(zone).format(next_start, '%H:%M')}"
+    return message
+
+# Тексты уведомлений готовятся заранее, в момент отправки берется готовая строка
+MESSAGE_CACHE = MessageCache(render_notification_message, path=MESSAGE_CACHE_FILE)
+
+def prepare_notification_messages(snapshot: TimelineSnapshot, zone: str = MESSAGE_TIMEZONE):
+    """Заранее готовит тексты уведомлений для ближайших событий"""
+    MESSAGE_CACHE.load()
     
-    # Добавляем время следующего события если есть
-    if next_event:
-        next_kiev = next_event['event_start'].astimezone(kiev_tz)
-        message += f"Следующие прибытие: {next_kiev.strftime('%H:%M')}"
-    else:
-        # Если не удалось определить следующее событие, показываем стандартное время
-        next_time = event_start + EVENT_INTERVAL
-        next_kiev = next_time.astimezone(kiev_tz)
-        message += f"Следующие прибытие: {next_kiev.strftime('%H:%M')}"
+    matches = snapshot.matches
+    first_index = matches[0].event.index if matches else snapshot.next_event.index
+    MESSAGE_CACHE.prefill(min(first_index, snapshot.next_event.index), MESSAGE_PREFILL_COUNT, zone)
     
-    return message
+    MESSAGE_CACHE.save()
+
+def format_notification_message(event, zone: str = MESSAGE_TIMEZONE):
+    """Форматирует сообщение для уведомления в момент появления острова"""
+    return MESSAGE_CACHE.get(event.index, zone)
 
-def schedule_next_notification():
-    """Планирует следующее уведомление (сначала FastCron, потом cron-job.org)"""
-    next_event = get_next_notification_event()
+def schedule_rolling_window(window: int = ROLLING_WINDOW, sent_event: Event = None,
+                            snapshot: TimelineSnapshot = None):
+    """Держит запланированными ближайшие window уведомлений, создавая только недостающие"""
+    try:
+        from job_ledger import top_up_window
+    except ImportError as e:
+        print(f"⚠️ Модули планирования недоступны: {e}")
+        return False
+    
+    # Окно начинается после события, о котором только что отправлено уведомление
+    snapshot = snapshot or TimelineSnapshot()
+    first = get_event_after(sent_event, snapshot) if sent_event else snapshot.next_event
+    notification_times = [Event(first.index + offset).notification_time for offset in range(window)]
+    
+    print(f"📅 Окно заданий: {window} уведомлений, "
+          f"с {notification_times[0].strftime('%d.%m.%Y %H:%M')} "
+          f"по {notification_times[-1].strftime('%d.%m.%Y %H:%M')} UTC")
+    result = top_up_window(notification_times, snapshot.now)
+    return not result.failed
+
+def schedule_next_notification(snapshot: TimelineSnapshot = None, sent_event: Event = None):
+    """
+    Планирует следующее уведомление (сначала FastCron, потом cron-job.org)
+    sent_event - только что отправленное событие: планируется событие после него
+    """
+    if ROLLING_WINDOW > 0:
+        return schedule_rolling_window(sent_event=sent_event, snapshot=snapshot)
+    
+    if sent_event:
+        next_event = get_event_after(sent_event, snapshot)
+    else:
+        next_event = get_next_notification_event(snapshot)
     if not next_event:
         print("❌ Не найдено следующее событие для планирования")
         return False
@@ -222,35 +443,35 @@ def schedule_next_notification():
     print(f"   Событие: {event_start.strftime('%d.%m.%Y %H:%M')} UTC")
     print(f"   В момент появления острова")
     
-    # Сначала пробуем FastCron (лучше с rate limiting)
+    # Провайдеры в порядке предпочтения: сначала FastCron (лучше с rate limiting), потом cron-job.org
     try:
-        from setup_fastcron import create_single_notification_job as create_fastcron_job
-        fastcron_api_key = os.environ.get('FASTCRON_API_KEY')
-        if fastcron_api_key:
-            print(f"🚀 Пробуем FastCron API...")
-            result = create_fastcron_job(notification_time)
-            if result:
-                print(f"✅ FastCron: следующее уведомление запланировано")
-                return result
-            else:
-                print(f"⚠️ FastCron не сработал, пробуем cron-job.org...")
-        else:
-            print(f"📝 FASTCRON_API_KEY не настроен, пробуем cron-job.org...")
-    except ImportError:
-        print(f"📝 Модуль setup_fastcron недоступен, пробуем cron-job.org...")
-    
-    # Откат на cron-job.org
-    try:
-        from setup_cronjob import create_single_notification_job as create_cronjob_job
-        return create_cronjob_job(notification_time)
+        from cron_providers import get_configured_providers, hedged_create
     except ImportError as e:
         print(f"⚠️ Модули планирования недоступны: {e}")
         return False
+    
+    providers = get_configured_providers()
+    if not providers:
+        print(f"📝 Не настроен ни один cron-провайдер (FASTCRON_API_KEY, CRONJOB_API_KEY)")
+        return False
+    
+    # Следующий провайдер запускается параллельно, если предыдущий не успел ответить
+    print(f"🚀 Планируем через: {', '.join(provider.display_name for provider in providers)}")
+    result = hedged_create(providers, notification_time)
+    
+    if result.provider:
+        print(f"✅ {result.provider.display_name}: следующее уведомление запланировано "
+              f"за {result.elapsed:.1f} сек")
+        return result.job_id
+    
+    print(f"❌ Не удалось запланировать уведомление ({result.elapsed:.1f} сек)")
+    return False
 
-def show_schedule_info():
+def show_schedule_info(snapshot: TimelineSnapshot = None):
     """Показывает информацию о расписании событий"""
-    now = datetime.now(pytz.UTC)
-    events = calculate_next_events(now, count=5)
+    snapshot = snapshot or TimelineSnapshot()
+    now = snapshot.now
+    events = snapshot.upcoming(5)
     
     print(f"📅 РАСПИСАНИЕ FLOATING ISLAND")
     print("=" * 50)
@@ -260,21 +481,18 @@ def show_schedule_info():
     print(f"🎈 Продолжительность: {EVENT_DURATION.seconds//60} минут")
     print()
     
-    kiev_tz = pytz.timezone('Europe/Kiev')
+    kiev = get_renderer('Europe/Kiev')
     
     for i, event in enumerate(events, 1):
         notification_time = event['notification_time']
         event_start = event['event_start']
         
-        nt_kiev = notification_time.astimezone(kiev_tz)
-        et_kiev = event_start.astimezone(kiev_tz)
-        
         time_until_notification = (notification_time - now).total_seconds()
         time_until_event = (event_start - now).total_seconds()
         
         print(f"🎈 Событие {i}:")
-        print(f"   📢 Уведомление: {nt_kiev.strftime('%d.%m %H:%M')} (Киев)")
-        print(f"   🎈 Событие: {et_kiev.strftime('%d.%m %H:%M')} (Киев)")
+        print(f"   📢 Уведомление: {kiev.format(notification_time, '%d.%m %H:%M')} (Киев)")
+        print(f"   🎈 Событие: {kiev.format(event_start, '%d.%m %H:%M')} (Киев)")
         
         if time_until_notification > 0:
             hours = int(time_until_notification // 3600)
@@ -286,22 +504,59 @@ def show_schedule_info():
             print(f"   ✅ Событие прошло")
         print()
 
+def prewarm_telegram():
+    """Открывает соединение с api.telegram.org заранее, чтобы отправка не ждала DNS, TCP и TLS"""
+    if not BOT_TOKEN:
+        return None
+    elapsed = http_client.prewarm(f"https://api.telegram.org/bot{BOT_TOKEN}/getMe", timeout=10)
+    if elapsed is not None:
+        print(f"🔥 Соединение с Telegram прогрето за {elapsed * 1000:.0f} мс")
+    return elapsed
+
+def wait_until(moment: datetime):
+    """
+    Спит до moment: задание ставится раньше события на задержку запуска workflow
+    За PREWARM_LEAD до отправки прогревает соединение с Telegram
+    """
+    remaining = (moment - datetime.now(pytz.UTC)).total_seconds()
+    if remaining <= 0:
+        return
+    
+    print(f"⏳ Ждем начала события: {remaining:.1f} сек")
+    time.sleep(max(0.0, remaining - PREWARM_LEAD.total_seconds()))
+    prewarm_telegram()
+    
+    remaining = (moment - datetime.now(pytz.UTC)).total_seconds()
+    if remaining > 0:
+        time.sleep(remaining)
+
 def main():
     """Основная функция - отправляет уведомление и планирует следующее"""
+    # Один снимок расписания и одно значение времени на весь запуск
+    snapshot = TimelineSnapshot(last_sent=load_last_sent())
+    
     print(f"🤖 Запуск проверки Floating Island Bot...")
-    print(f"⏰ Текущее время: {datetime.now(pytz.UTC).strftime('%Y-%m-%d %H:%M:%S')} UTC")
+    print(f"⏰ Текущее время: {snapshot.now.strftime('%Y-%m-%d %H:%M:%S')} UTC")
     
     # Проверяем аргументы командной строки для тестовых режимов
     if len(sys.argv) > 1:
         if sys.argv[1] == '--test' or sys.argv[1] == '--test-send':
-            test_notification()
+            test_notification(snapshot)
             return
         elif sys.argv[1] == '--schedule':
-            show_schedule_info()
+            show_schedule_info(snapshot)
             return
+        elif sys.argv[1] == '--daemon':
+            # Долгоживущий процесс вместо внешних cron-сервисов
+            from notify_daemon import run_daemon
+            run_daemon()
+            return
+    
+    # Готовим тексты заранее, чтобы не рендерить их в момент отправки
+    prepare_notification_messages(snapshot)
     
     # Проверяем, есть ли событие для уведомления прямо сейчас
-    current_event = get_current_notification_event()
+    current_event = get_current_notification_event(snapshot)
     
     if current_event:
         print(f"🚨 Остров ПОЯВИЛСЯ! Отправляем уведомление:")
@@ -313,12 +568,20 @@ def main():
         
         message = format_notification_message(current_event)
         
+        # Отправляем точно в момент появления острова
+        wait_until(event_start)
+        
         if send_telegram_message(message):
             print(f"✅ Уведомление отправлено успешно")
+            save_last_sent(current_event.index)
+            print(f"📦 Кэш сообщений: {MESSAGE_CACHE.stats()}")
+            
+            # Задержку запуска замеряем после отправки, чтобы не задерживать сообщение
+            record_dispatch_latency(snapshot.now)
             
-            # Планируем следующее уведомление
+            # Планируем событие после отправленного: снимок взят до ожидания event_start
             print(f"\n🔄 Планируем следующее уведомление...")
-            if schedule_next_notification():
+            if schedule_next_notification(sent_event=current_event):
                 print(f"✅ Следующее уведомление запланировано")
             else:
                 print(f"⚠️ Не удалось запланировать следующее уведомление")
@@ -329,19 +592,20 @@ def main():
         print("💡 Возможно, бот запущен не в точное время уведомления")
         
         # Показываем ближайшие события для справки
-        next_event = get_next_notification_event()
+        next_event = get_next_notification_event(snapshot)
         if next_event:
             nt = next_event['notification_time']
             et = next_event['event_start']
             print(f"📅 Следующее уведомление: {nt.strftime('%d.%m.%Y %H:%M')} UTC")
             print(f"🎈 Следующее событие: {et.strftime('%d.%m.%Y %H:%M')} UTC")
 
-def test_notification():
+def test_notification(snapshot: TimelineSnapshot = None):
     """Отправляет тестовое уведомление для проверки работы бота"""
     print("🧑‍🔬 ТЕСТ СИСТЕМЫ УВЕДОМЛЕНИЙ")
     print("=" * 50)
     
-    now = datetime.now(pytz.UTC)
+    snapshot = snapshot or TimelineSnapshot()
+    now = snapshot.now
     print(f"⏰ Время теста: {now.strftime('%Y-%m-%d %H:%M:%S')} UTC")
     
     # Проверяем настройки
@@ -358,16 +622,15 @@ def test_notification():
     print()
     
     # Показываем информацию о ближайших событиях
-    next_event = get_next_notification_event()
+    next_event = get_next_notification_event(snapshot)
     if next_event:
         nt = next_event['notification_time']
         et = next_event['event_start']
-        kiev_tz = pytz.timezone('Europe/Kiev')
-        et_kiev = et.astimezone(kiev_tz)
+        et_kiev = get_renderer('Europe/Kiev').format(et)
         
         print(f"📅 Ближайшее событие:")
         print(f"   Уведомление: {nt.strftime('%d.%m.%Y %H:%M')} UTC")
-        print(f"   Событие: {et_kiev.strftime('%d.%m.%Y %H:%M')} (Киев)")
+        print(f"   Событие: {et_kiev} (Киев)")
         print()
     
     # Создаем тестовое сообщение
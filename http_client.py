@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Общий HTTP клиент для всех модулей (Telegram, GitHub, FastCron, cron-job.org)
+Держит по одной сессии с пулом keep-alive соединений на каждый хост,
+поэтому повторные запросы не открывают новое TCP+TLS соединение.
+Для каждого запроса записывается время выполнения и было ли соединение теплым.
+Запросы к cron-провайдерам проходят через их адаптивные лимитеры (rate_limiter)
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from rate_limiter import get_limiter_for_url, get_limiters
+
+# Настройки пула (можно переопределить переменными окружения или через configure)
+POOL_SIZE = int(os.environ.get('HTTP_POOL_SIZE', '10'))  # Соединений на один хост
+DEFAULT_TIMEOUT = float(os.environ.get('HTTP_TIMEOUT', '30'))  # Таймаут по умолчанию, сек
+WARM_WINDOW = float(os.environ.get('HTTP_WARM_WINDOW', '30'))  # Соединение к хосту считаем теплым столько сек
+
+_sessions = {}
+_pool_sizes = {}  # Хост -> размер пула его сессии
+_sessions_lock = threading.Lock()
+
+_metrics = []
+_metrics_lock = threading.Lock()
+
+_last_used = {}  # Хост -> time.monotonic() последнего ответа
+
+def configure(pool_size: int = None, timeout: float = None):
+    """
+    Меняет размер пула и таймаут по умолчанию
+    Пул уже открытой сессии, который меньше pool_size, пересоздается только для ее хоста,
+    сессии остальных хостов и их соединения не трогаются
+    """
+    global POOL_SIZE, DEFAULT_TIMEOUT
+    if timeout is not None:
+        DEFAULT_TIMEOUT = timeout
+    if pool_size is None:
+        return
+    with _sessions_lock:
+        POOL_SIZE = pool_size
+        for host, session in _sessions.items():
+            if _pool_sizes.get(host, 0) < pool_size:
+                old_adapter = session.get_adapter(host)
+                _mount(session, host)
+                old_adapter.close()
+                _last_used.pop(host, None)
+
+def _mount(session: requests.Session, host: str):
+    session.mount(host, HTTPAdapter(pool_connections=1, pool_maxsize=POOL_SIZE))
+    _pool_sizes[host] = POOL_SIZE
+
+def _host(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+def get_session(url: str) -> requests.Session:
+    """Возвращает общую сессию для хоста из url"""
+    host = _host(url)
+
+    session = _sessions.get(host)
+    if session is not None:
+        return session
+
+    with _sessions_lock:
+        session = _sessions.get(host)
+        if session is None:
+            session = requests.Session()
+            _mount(session, host)
+            _sessions[host] = session
+    return session
+
+def is_warm(url: str) -> bool:
+    """Есть ли к хосту недавно использованное keep-alive соединение"""
+    last_used = _last_used.get(_host(url))
+    return last_used is not None and time.monotonic() - last_used < WARM_WINDOW
+
+def request(method: str, url: str, **kwargs) -> requests.Response:
+    """Выполняет HTTP запрос через общую сессию и записывает время выполнения"""
+    kwargs.setdefault('timeout', DEFAULT_TIMEOUT)
+    session = get_session(url)
+    warm = is_warm(url)
+
+    # Для cron-провайдеров ждем разрешения лимитера, а по ответу подстраиваем скорость
+    limiter = get_limiter_for_url(url)
+    if limiter:
+        limiter.acquire()
+
+    started = time.perf_counter()
+    status = None
+    try:
+        response = session.request(method, url, **kwargs)
+        status = response.status_code
+        _last_used[_host(url)] = time.monotonic()
+        if limiter:
+            limiter.observe(status, response.headers)
+        return response
+    finally:
+        elapsed = time.perf_counter() - started
+        with _metrics_lock:
+            _metrics.append({
+                'method': method,
+                'host': urlsplit(url).netloc,
+                'status': status,  # None - запрос завершился исключением
+                'elapsed': elapsed,
+                'warm': warm
+            })
+
+def get(url: str, **kwargs) -> requests.Response:
+    return request('GET', url, **kwargs)
+
+def post(url: str, **kwargs) -> requests.Response:
+    return request('POST', url, **kwargs)
+
+def put(url: str, **kwargs) -> requests.Response:
+    return request('PUT', url, **kwargs)
+
+def delete(url: str, **kwargs) -> requests.Response:
+    return request('DELETE', url, **kwargs)
+
+def iter_json_array(response: requests.Response, key: str, chunk_size: int = 65536):
+    """
+    Потоково разбирает массив key верхнего уровня JSON-объекта из ответа (stream=True)
+    и отдает элементы по одному: в памяти только текущий элемент и один блок данных
+    """
+    if response.encoding is None:
+        response.encoding = 'utf-8'
+    chunks = response.iter_content(chunk_size=chunk_size, decode_unicode=True)
+    decoder = json.JSONDecoder()
+    buffer = ''
+    position = 0
+    exhausted = False
+
+    def fill() -> bool:
+        nonlocal buffer, position, exhausted
+        chunk = None if exhausted else next(chunks, None)
+        if chunk is None:
+            exhausted = True
+            return False
+        # Разобранную часть буфера отбрасываем
+        buffer = buffer[position:] + chunk
+        position = 0
+        return True
+
+    def peek() -> str:
+        """Следующий непробельный символ; '' - поток закончился"""
+        nonlocal position
+        while True:
+            while position < len(buffer) and buffer[position] in ' \t\r\n':
+                position += 1
+            if position < len(buffer):
+                return buffer[position]
+            if not fill():
+                return ''
+
+    def decode():
+        """Следующее JSON-значение; при нехватке данных дочитывает поток"""
+        nonlocal position
+        peek()
+        while True:
+            try:
+                value, end = decoder.raw_decode(buffer, position)
+                # Значение принимаем, только когда за ним виден разделитель:
+                # число на границе блока ('0.', '1e') может продолжиться в следующем
+                following = end
+                while following < len(buffer) and buffer[following] in ' \t\r\n':
+                    following += 1
+                if following < len(buffer) and buffer[following] in ',:]}':
+                    position = end
+                    return value
+                if exhausted:
+                    raise ValueError("Некорректный JSON: после значения нет разделителя")
+            except json.JSONDecodeError:
+                if exhausted:
+                    raise
+            fill()
+
+    def expect(char: str):
+        nonlocal position
+        if peek() != char:
+            raise ValueError(f"Некорректный JSON: ожидался '{char}'")
+        position += 1
+
+    # Пропускаем поля объекта до нужного массива
+    expect('{')
+    while True:
+        char = peek()
+        if char == ',':
+            position += 1
+            continue
+        if char in ('}', ''):
+            raise ValueError(f"В ответе нет массива '{key}'")
+        name = decode()
+        expect(':')
+        if name == key and peek() == '[':
+            position += 1
+            break
+        decode()
+
+    while True:
+        char = peek()
+        if char == ',':
+            position += 1
+            continue
+        if char == ']':
+            return
+        if char == '':
+            raise ValueError(f"Ответ оборвался внутри массива '{key}'")
+        yield decode()
+
+def prewarm(url: str, method: str = 'GET', **kwargs) -> float:
+    """
+    Заранее открывает соединение к хосту (DNS, TCP, TLS) легким запросом,
+    чтобы следующий важный запрос пошел по теплому соединению
+    Возвращает время прогрева в секундах или None при ошибке
+    """
+    started = time.perf_counter()
+    try:
+        request(method, url, **kwargs)
+    except Exception as e:
+        print(f"⚠️ Не удалось прогреть соединение к {urlsplit(url).netloc}: {e}")
+        return None
+    return time.perf_counter() - started
+
+def get_metrics():
+    """Возвращает копию записей о выполненных запросах"""
+    with _metrics_lock:
+        return list(_metrics)
+
+def summarize_metrics():
+    """Группирует метрики по хостам: количество, ошибки, среднее и максимальное время"""
+    summary = {}
+    for record in get_metrics():
+        host = summary.setdefault(record['host'], {
+            'count': 0, 'errors': 0, 'total': 0.0, 'max': 0.0,
+            'warm': 0, 'warm_total': 0.0, 'cold': 0, 'cold_total': 0.0
+        })
+        host['count'] += 1
+        kind = 'warm' if record['warm'] else 'cold'
+        host[kind] += 1
+        host[f'{kind}_total'] += record['elapsed']
+        if record['status'] is None or record['status'] >= 400:
+            host['errors'] += 1
+        host['total'] += record['elapsed']
+        host['max'] = max(host['max'], record['elapsed'])
+    return summary
+
+def print_metrics():
+    """Печатает сводку времени HTTP запросов по хостам"""
+    summary = summarize_metrics()
+    if not summary:
+        return
+
+    print("\n📶 HTTP запросы:")
+    for host, stats in summary.items():
+        average_ms = stats['total'] / stats['count'] * 1000
+        print(f"   {host}: {stats['count']} запр., ошибок {stats['errors']}, "
+              f"среднее {average_ms:.0f} мс, макс {stats['max'] * 1000:.0f} мс")
+        for kind, label in (('cold', 'холодные'), ('warm', 'теплые')):
+            if stats[kind]:
+                print(f"      {label}: {stats[kind]}, среднее "
+                      f"{stats[f'{kind}_total'] / stats[kind] * 1000:.0f} мс")
+
+    for limiter in get_limiters():
+        print(f"   ⏱️ Лимитер {limiter.stats()}")
+
+def close():
+    """Закрывает все сессии и их соединения"""
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+        _pool_sizes.clear()
+        _last_used.clear()
+
+atexit.register(print_metrics)
\ No newline at end of file
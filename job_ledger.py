@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Скользящее окно заданий уведомлений
+Вместо пачки из 30-100 одноразовых заданий у провайдеров всегда стоят задания
+на ближайшие N событий. Каждый запуск бота удаляет сработавшие задания и создает
+только недостающие - обычно одно. ID заданий берутся из локального хранилища
+job_store, поэтому списки заданий у провайдеров запрашиваются только для сверки
+"""
+
+from datetime import datetime
+from typing import NamedTuple
+
+from cron_providers import get_configured_providers, get_provider, hedged_create
+from job_store import JobStore, get_job_store
+
+class TopUpResult(NamedTuple):
+    """Итог пополнения окна"""
+    created: list  # Времена уведомлений, для которых создано задание
+    deleted: list  # Удаленные сработавшие задания (StoredJob)
+    failed: list  # Времена уведомлений, задание для которых создать не удалось
+
+def top_up_window(notification_times, now: datetime, store: JobStore = None) -> TopUpResult:
+    """
+    Держит задания ровно на notification_times (ближайшие N уведомлений):
+    удаляет сработавшие задания и создает недостающие
+    """
+    store = store or get_job_store()
+    providers = get_configured_providers()
+
+    # Пустое хранилище (нет кэша) или давняя сверка - один запрос списка к провайдеру
+    for provider in providers:
+        if store.needs_audit(provider.name):
+            provider.sync_jobs()
+
+    # Сработавшие задания удаляем у их провайдеров пачкой (хранилище обновляет delete_job)
+    deleted = []
+    by_provider = {}
+    for job in store.expired(now):
+        by_provider.setdefault(job.provider, []).append(job)
+    for name, jobs in by_provider.items():
+        result = get_provider(name).delete_jobs([(job.job_id, job.title) for job in jobs])
+        removed = set(job_id for job_id, _ in result.deleted)
+        deleted.extend(job for job in jobs if job.job_id in removed)
+
+    # Новые задания записывает в хранилище create_job
+    created = []
+    failed = []
+    for notification_time in sorted(set(notification_times) - store.notification_times()):
+        if hedged_create(providers, notification_time).provider:
+            created.append(notification_time)
+        else:
+            failed.append(notification_time)
+
+    print(f"📒 Окно заданий: создано {len(created)}, удалено {len(deleted)}, "
+          f"не удалось {len(failed)}, всего в хранилище {len(store.notification_times())}")
+    return TopUpResult(created=created, deleted=deleted, failed=failed)
\ No newline at end of file
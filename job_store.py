@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Локальное хранилище заданий cron-провайдеров (SQLite)
+Каждое создание и удаление задания через cron_providers сразу записывается сюда,
+поэтому список заданий и очистка - локальные запросы. Список у провайдера
+запрашивается только для сверки: при первом запуске (пустое хранилище)
+и не реже раза в AUDIT_INTERVAL. Между запусками GitHub Actions файл
+сохраняется в actions/cache. Повторные списки заданий отдает хранилище,
+поэтому отдельный кэш HTTP-ответов со списками не нужен
+"""
+
+import atexit
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from typing import NamedTuple
+
+import pytz
+
+from floating_island_bot import NOTIFICATION_ADVANCE, get_event_index_at_or_after, get_event_start
+from reconcile import parse_notification_job_title
+
+JOB_STORE_FILE = os.environ.get('JOB_STORE_FILE', 'job_store.db')
+# Как часто сверять хранилище со списком заданий провайдера
+AUDIT_INTERVAL = timedelta(hours=float(os.environ.get('JOB_AUDIT_INTERVAL_HOURS') or '24'))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    provider TEXT NOT NULL,
+    job_id TEXT NOT NULL,
+    event_index INTEGER,
+    notification_time TEXT,
+    title TEXT NOT NULL,
+    job TEXT NOT NULL,
+    PRIMARY KEY (provider, job_id)
+);
+CREATE INDEX IF NOT EXISTS jobs_event ON jobs (provider, event_index);
+CREATE INDEX IF NOT EXISTS jobs_time ON jobs (notification_time);
+CREATE TABLE IF NOT EXISTS audits (
+    provider TEXT PRIMARY KEY,
+    audited_at TEXT NOT NULL
+);
+"""
+
+TIME_FORMAT = '%Y-%m-%dT%H:%M:%S'  # UTC; строки сортируются так же, как время
+
+class StoredJob(NamedTuple):
+    """Задание провайдера в локальном хранилище"""
+    provider: str  # Ключ провайдера в cron_providers.PROVIDERS
+    job_id: object
+    event_index: int  # None - не задание уведомления (например, Checker)
+    notification_time: datetime
+    title: str
+    job: dict  # Задание в формате списка заданий провайдера
+
+def event_index(notification_time: datetime) -> int:
+    """Индекс события для времени уведомления; None, если время не совпадает с событием"""
+    event_time = notification_time + NOTIFICATION_ADVANCE
+    index = get_event_index_at_or_after(event_time)
+    if get_event_start(index) != event_time:
+        return None
+    return index
+
+def _format_time(moment: datetime) -> str:
+    return moment.astimezone(pytz.UTC).strftime(TIME_FORMAT) if moment else None
+
+def _parse_time(value: str) -> datetime:
+    return pytz.UTC.localize(datetime.strptime(value, TIME_FORMAT)) if value else None
+
+class JobStore:
+    """Индекс заданий по провайдеру, ID задания и индексу события"""
+
+    def __init__(self, path: str = JOB_STORE_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = None
+
+    def _connect(self) -> sqlite3.Connection:
+        # Одно соединение на процесс: задания создаются из нескольких потоков
+        if self._connection is None:
+            connection = sqlite3.connect(self.path or ':memory:', check_same_thread=False)
+            # Файл целиком сохраняется в actions/cache: каждая транзакция должна быть
+            # в основном файле, а не в -wal, который не кэшируется и теряется при обрыве шага.
+            # Режим WAL хранится в самом файле, поэтому старые файлы переводим явно
+            connection.execute('PRAGMA journal_mode=DELETE')
+            connection.executescript(SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def close(self):
+        """Закрывает соединение"""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _execute(self, query: str, params=()):
+        # Ошибка хранилища не должна срывать работу с провайдером - сверка ее исправит
+        try:
+            with self._lock:
+                connection = self._connect()
+                with connection:
+                    return connection.execute(query, params).fetchall()
+        except sqlite3.Error as e:
+            print(f"⚠️ Ошибка хранилища заданий {self.path}: {e}")
+            return []
+
+    def _row(self, provider: str, job_id, notification_time: datetime, title: str, job: dict):
+        index = event_index(notification_time) if notification_time else None
+        return (provider, json.dumps(job_id), index, _format_time(notification_time),
+                title, json.dumps(job, ensure_ascii=False))
+
+    def record_created(self, provider: str, job_id, notification_time: datetime, title: str, job: dict):
+        """Записывает созданное задание"""
+        self._execute('INSERT OR REPLACE INTO jobs VALUES (?, ?, ?, ?, ?, ?)',
+                      self._row(provider, job_id, notification_time, title, job))
+
+    def record_deleted(self, provider: str, job_id):
+        """Убирает удаленное задание"""
+        self._execute('DELETE FROM jobs WHERE provider = ? AND job_id = ?', (provider, json.dumps(job_id)))
+
+    def jobs(self, provider: str = None) -> list:
+        """Задания провайдера (или всех), уведомления - по времени, затем остальные"""
+        query = 'SELECT provider, job_id, event_index, notification_time, title, job FROM jobs'
+        params = ()
+        if provider is not None:
+            query += ' WHERE provider = ?'
+            params = (provider,)
+        query += ' ORDER BY notification_time IS NULL, notification_time, title'
+        return [
+            StoredJob(row[0], json.loads(row[1]), row[2], _parse_time(row[3]), row[4], json.loads(row[5]))
+            for row in self._execute(query, params)
+        ]
+
+    def expired(self, now: datetime, provider: str = None) -> list:
+        """Задания уведомлений, время которых уже прошло"""
+        return [job for job in self.jobs(provider) if job.notification_time and job.notification_time <= now]
+
+    def notification_times(self, provider: str = None) -> set:
+        """Времена уведомлений, для которых есть задание"""
+        return {job.notification_time for job in self.jobs(provider) if job.notification_time}
+
+    def needs_audit(self, provider: str, now: datetime = None) -> bool:
+        """Пора сверить хранилище со списком заданий провайдера"""
+        rows = self._execute('SELECT audited_at FROM audits WHERE provider = ?', (provider,))
+        if not rows:
+            return True
+        now = now or datetime.now(pytz.UTC)
+        return now - _parse_time(rows[0][0]) >= AUDIT_INTERVAL
+
+    def replace(self, provider: str, jobs, now: datetime = None):
+        """
+        Заменяет задания провайдера списком или потоком (job_id, title, job) из его API
+        Возвращает (только локально, только у провайдера) - число расхождений
+        """
+        now = now or datetime.now(pytz.UTC)
+        remote = set()
+
+        def rows():
+            # jobs может быть потоком: строки пишутся по мере разбора ответа
+            for job_id, title, job in jobs:
+                if job_id:
+                    row = self._row(provider, job_id, parse_notification_job_title(title, now), title, job)
+                    remote.add(row[1])
+                    yield row
+
+        # Ошибка чтения jobs откатывает транзакцию - прежнее содержимое сохраняется
+        try:
+            with self._lock:
+                connection = self._connect()
+                with connection:
+                    local = {row[0] for row in connection.execute(
+                        'SELECT job_id FROM jobs WHERE provider = ?', (provider,))}
+                    connection.execute('DELETE FROM jobs WHERE provider = ?', (provider,))
+                    connection.executemany('INSERT OR REPLACE INTO jobs VALUES (?, ?, ?, ?, ?, ?)', rows())
+                    connection.execute('INSERT OR REPLACE INTO audits VALUES (?, ?)',
+                                       (provider, _format_time(now)))
+        except sqlite3.Error as e:
+            print(f"⚠️ Ошибка хранилища заданий {self.path}: {e}")
+            return 0, 0
+
+        return len(local - remote), len(remote - local)
+
+_store = None
+_store_lock = threading.Lock()
+
+def get_job_store() -> JobStore:
+    """Общее хранилище процесса (закрывается при выходе)"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = JobStore()
+            atexit.register(_store.close)
+        return _store
\ No newline at end of file
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Кэш заранее подготовленных текстов уведомлений
+Текст уведомления зависит только от индекса события и часового пояса,
+поэтому его можно подготовить заранее и в момент отправки только взять готовую строку
+"""
+
+import json
+import os
+from collections import OrderedDict
+
+DEFAULT_CACHE_SIZE = 64  # Сколько сообщений держим в памяти
+
+class MessageCache:
+    """LRU-кэш сообщений с ключом (индекс события, часовой пояс) и счетчиками попаданий"""
+
+    def __init__(self, render, maxsize: int = DEFAULT_CACHE_SIZE, path: str = None):
+        self.render = render  # render(index, zone) -> str
+        self.maxsize = maxsize
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._messages = OrderedDict()
+
+    def get(self, index: int, zone: str) -> str:
+        """Возвращает готовое сообщение, при промахе рендерит и запоминает его"""
+        key = (index, zone)
+        message = self._messages.get(key)
+        if message is not None:
+            self.hits += 1
+            self._messages.move_to_end(key)
+            return message
+
+        self.misses += 1
+        message = self.render(index, zone)
+        self._store(key, message)
+        return message
+
+    def prefill(self, first_index: int, count: int, zone: str):
+        """Заранее рендерит сообщения для count событий начиная с first_index"""
+        for index in range(first_index, first_index + min(count, self.maxsize)):
+            key = (index, zone)
+            if key not in self._messages:
+                self._store(key, self.render(index, zone))
+
+    def _store(self, key, message: str):
+        self._messages[key] = message
+        self._messages.move_to_end(key)
+        while len(self._messages) > self.maxsize:
+            self._messages.popitem(last=False)
+
+    def load(self) -> bool:
+        """Загружает сообщения из файла path (если он задан и существует)"""
+        if not self.path or not os.path.exists(self.path):
+            return False
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+            # Файл с чужой структурой не должен ронять отправку уведомления
+            loaded = [((entry['index'], entry['zone']), entry['message'])
+                      for entry in entries[-self.maxsize:]]
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"⚠️ Не удалось прочитать кэш сообщений {self.path}: {e}")
+            return False
+
+        for key, message in loaded:
+            self._store(key, message)
+        return True
+
+    def save(self) -> bool:
+        """Сохраняет сообщения в файл path (если он задан)"""
+        if not self.path:
+            return False
+
+        entries = [
+            {'index': index, 'zone': zone, 'message': message}
+            for (index, zone), message in self._messages.items()
+        ]
+        try:
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump(entries, f, ensure_ascii=False)
+        except OSError as e:
+            print(f"⚠️ Не удалось сохранить кэш сообщений {self.path}: {e}")
+            return False
+        return True
+
+    def stats(self) -> str:
+        """Короткая строка со статистикой кэша"""
+        return f"попаданий {self.hits}, промахов {self.misses}, в кэше {len(self._messages)}"
\ No newline at end of file
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Режим демона: бот держит расписание в памяти и сам отправляет уведомления
+Без внешнего cron-сервиса и запуска GitHub Actions - процесс спит по монотонным
+часам до момента уведомления и сразу отправляет сообщение в Telegram.
+Ожидание периодически сверяется с системными часами (коррекция дрейфа),
+а момент пробуждения сдвигается на среднее время отправки.
+Ожидающие уведомления хранятся в колесе таймеров (timing_wheel)
+"""
+
+import json
+import os
+import signal
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytz
+
+import floating_island_bot as bot
+from timing_wheel import TimingWheel
+
+MAX_SLEEP = 60.0  # Сверяемся с системными часами не реже раза в минуту
+MAX_LEAD = 5.0  # Максимальный сдвиг пробуждения на время отправки, сек
+LATENCY_SMOOTHING = 0.3  # Вес нового замера в скользящем среднем времени отправки
+SEND_ATTEMPTS = 3  # Попыток отправки, пока не вышли за допуск
+STATE_FILE = os.environ.get('DAEMON_STATE_FILE')  # Файл состояния для перезапуска
+TIMER_TICK = 0.1  # Тик колеса таймеров, сек
+DAEMON_HORIZON = timedelta(hours=24)  # На сколько вперед держим таймеры уведомлений
+
+class NotificationDaemon:
+    """Долгоживущий процесс, отправляющий уведомления точно в момент события"""
+
+    def __init__(self, state_path: str = STATE_FILE, tolerance: timedelta = bot.NOTIFICATION_TOLERANCE):
+        self.state_path = state_path
+        self.tolerance = tolerance
+        self.last_sent = None  # Индекс последнего отправленного события
+        self.send_latency = 0.0  # Скользящее среднее времени отправки, сек
+        self.restart_requested = False
+        self.timers = TimingWheel(tick=TIMER_TICK)
+        self.pending = {}  # Индекс события -> таймер уведомления
+        self._stop = threading.Event()
+
+    def load_state(self):
+        """Восстанавливает последнее отправленное событие после перезапуска"""
+        state = {}
+        if self.state_path and os.path.exists(self.state_path):
+            try:
+                with open(self.state_path, 'r', encoding='utf-8') as f:
+                    state = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"⚠️ Не удалось прочитать состояние демона {self.state_path}: {e}")
+
+        # При перезапуске через SIGHUP состояние передается и через окружение
+        if 'last_sent' not in state and os.environ.get('DAEMON_LAST_SENT'):
+            state['last_sent'] = int(os.environ['DAEMON_LAST_SENT'])
+
+        self.last_sent = state.get('last_sent')
+        self.send_latency = state.get('send_latency', self.send_latency)
+
+    def save_state(self):
+        """Сохраняет последнее отправленное событие (если задан файл состояния)"""
+        if self.last_sent is not None:
+            os.environ['DAEMON_LAST_SENT'] = str(self.last_sent)
+        if not self.state_path:
+            return
+
+        try:
+            with open(self.state_path, 'w', encoding='utf-8') as f:
+                json.dump({'last_sent': self.last_sent, 'send_latency': self.send_latency}, f)
+        except OSError as e:
+            print(f"⚠️ Не удалось сохранить состояние демона {self.state_path}: {e}")
+
+    def stop(self, restart: bool = False):
+        """Прерывает ожидание; при restart=True процесс перезапустится"""
+        self.restart_requested = self.restart_requested or restart
+        self._stop.set()
+
+    def install_signal_handlers(self):
+        """SIGTERM/SIGINT - остановка, SIGHUP - перезапуск"""
+        signal.signal(signal.SIGTERM, lambda signum, frame: self.stop())
+        signal.signal(signal.SIGINT, lambda signum, frame: self.stop())
+        if hasattr(signal, 'SIGHUP'):
+            signal.signal(signal.SIGHUP, lambda signum, frame: self.stop(restart=True))
+
+    def next_event(self, now: datetime) -> bot.Event:
+        """
+        Следующее событие для отправки
+        После перезапуска досылаем пропущенное уведомление, если оно еще в пределах допуска
+        """
+        if self.last_sent is None:
+            return bot.TimelineSnapshot(now).next_event
+
+        return bot.Event(max(self.last_sent + 1, bot.get_event_index_at_or_after(now - self.tolerance)))
+
+    def schedule_upcoming(self, now: datetime):
+        """Ставит таймеры на уведомления в пределах DAEMON_HORIZON (хотя бы одно)"""
+        # Таймер срабатывает раньше на среднее время отправки
+        lead = min(self.send_latency, MAX_LEAD)
+        event = self.next_event(now)
+        while True:
+            if event.index not in self.pending:
+                # Колесо будит заранее: прогреваем соединение, остаток дожидаемся точно
+                wake_at = event.notification_time - timedelta(seconds=lead)
+                deadline = wake_at.timestamp() - max(TIMER_TICK, bot.PREWARM_LEAD.total_seconds())
+                self.pending[event.index] = self.timers.schedule(deadline, (event, wake_at))
+                print(f"💤 Уведомление {event.notification_time.strftime('%d.%m.%Y %H:%M:%S')} UTC "
+                      f"(пробуждение на {lead:.3f} сек раньше)")
+            if event.notification_time > now + DAEMON_HORIZON:
+                break
+            event = bot.Event(event.index + 1)
+
+    def sleep_until(self, moment: datetime) -> bool:
+        """
+        Спит до moment по монотонным часам, сверяясь с системными не реже MAX_SLEEP
+        Возвращает False, если ожидание прервано сигналом
+        """
+        while not self._stop.is_set():
+            remaining = (moment - datetime.now(pytz.UTC)).total_seconds()
+            if remaining <= 0:
+                return True
+            # Длинное ожидание делим на отрезки: после каждого пересчитываем
+            # остаток по системным часам, поэтому дрейф не накапливается
+            self._stop.wait(min(remaining, MAX_SLEEP))
+        return False
+
+    def send(self, event: bot.Event) -> bool:
+        """Отправляет готовое сообщение и обновляет оценку времени отправки"""
+        message = bot.format_notification_message(event)
+
+        for attempt in range(SEND_ATTEMPTS):
+            started = time.monotonic()
+            sent = bot.send_telegram_message(message)
+            elapsed = time.monotonic() - started
+
+            if sent:
+                self.send_latency += LATENCY_SMOOTHING * (elapsed - self.send_latency)
+                lateness = (datetime.now(pytz.UTC) - event.event_start).total_seconds()
+                print(f"⏱️ Отклонение от начала события: {lateness:+.3f} сек "
+                      f"(отправка {elapsed:.3f} сек, среднее {self.send_latency:.3f} сек)")
+                return True
+
+            if datetime.now(pytz.UTC) - event.notification_time > self.tolerance:
+                break
+            print(f"🔁 Повторная отправка (попытка {attempt + 2}/{SEND_ATTEMPTS})")
+            self._stop.wait(1)
+
+        return False
+
+    def run(self):
+        """Основной цикл: ждать ближайший таймер, отправить все сработавшие, повторить"""
+        self.install_signal_handlers()
+        self.load_state()
+
+        print(f"🛰️ Демон Floating Island запущен (PID {os.getpid()})")
+
+        try:
+            while not self._stop.is_set():
+                now = datetime.now(pytz.UTC)
+                self.schedule_upcoming(now)
+
+                # Тексты готовим заранее, в момент отправки только берем строку
+                bot.prepare_notification_messages(bot.TimelineSnapshot(now))
+
+                wake_at = datetime.fromtimestamp(self.timers.next_due(), pytz.UTC)
+                if not self.sleep_until(wake_at):
+                    break
+
+                # Все уведомления одного тика приходят одной пачкой
+                batch = self.timers.advance()
+                if batch:
+                    bot.prewarm_telegram()
+
+                for timer in batch:
+                    event, wake_at = timer.payload
+                    del self.pending[event.index]
+                    if not self.sleep_until(wake_at):
+                        break
+
+                    print(f"🚨 Остров ПОЯВИЛСЯ! Отправляем уведомление о событии {event.index}")
+                    if not self.send(event):
+                        print(f"❌ Не удалось отправить уведомление о событии {event.index}")
+
+                    # Неудачное уведомление не повторяем бесконечно - переходим к следующему событию
+                    self.last_sent = max(event.index, self.last_sent if self.last_sent is not None else event.index)
+                    self.save_state()
+        finally:
+            self.save_state()
+
+        if self.restart_requested:
+            print("🔄 Перезапуск демона...")
+            sys.stdout.flush()
+            os.execv(sys.executable, [sys.executable] + sys.argv)
+
+        print("👋 Демон остановлен")
+
+def run_daemon():
+    """Запускает демон уведомлений"""
+    if not bot.BOT_TOKEN or not bot.CHAT_ID:
+        print("❌ Для режима демона нужны TELEGRAM_BOT_TOKEN и TELEGRAM_CHAT_ID")
+        return False
+
+    NotificationDaemon().run()
+    return True
+
+if __name__ == "__main__":
+    run_daemon()
\ No newline at end of file
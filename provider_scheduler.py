@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Планировщик заданий Floating Island для любого cron-провайдера
+Сверка расписания, очистка, просмотр и CLI общие для всех провайдеров,
+скрипты scheduler.py (cron-job.org) и fastcron_scheduler_fixed.py (FastCron)
+только выбирают провайдера и модуль проверки подключения
+"""
+
+import importlib
+import sys
+from datetime import datetime
+from itertools import islice
+import pytz
+
+from bulk_jobs import DEFAULT_CONCURRENCY, select_cleanup_jobs
+from cron_providers import CronProvider
+from reconcile import plan_reconciliation
+
+SHOWN_JOBS = 15  # Сколько запланированных уведомлений показывает list
+
+def create_precise_notification_job(provider: CronProvider, notification_time: datetime,
+                                    title: str = None, retry_count: int = 3):
+    """
+    Создает точное задание у провайдера для указанного времени
+    """
+    if not provider.validate_environment():
+        return False
+    return provider.create_job(notification_time, title, retry_count)
+
+def fetch_jobs(provider: CronProvider, audit: bool = False):
+    """
+    Получает список всех заданий провайдера из локального хранилища
+    С API сверяется при audit=True, при пустом хранилище и раз в сутки
+    Возвращает список заданий или None при ошибке
+    """
+    return provider.stored_jobs(audit)
+
+def list_all_jobs(provider: CronProvider):
+    """Показывает все задания аккаунта провайдера: Floating Island и остальные"""
+    if not provider.api_key:
+        print(f"❌ Не установлена переменная {provider.api_key_env}")
+        return False
+
+    try:
+        records = list(provider.iter_jobs(only_floating=False))
+    except Exception as e:
+        print(f"❌ Ошибка получения списка заданий {provider.display_name}: {e}")
+        return False
+
+    floating_jobs = [record for record in records if 'Floating Island' in record.title]
+    other_jobs = [record for record in records if 'Floating Island' not in record.title]
+
+    print(f"📋 Найдено {len(records)} заданий {provider.display_name}:")
+    print("=" * 80)
+    for label, group in ((f"🎈 Floating Island задания ({len(floating_jobs)}):", floating_jobs),
+                         (f"📌 Другие задания ({len(other_jobs)}):", other_jobs)):
+        if not group:
+            continue
+        print(label)
+        for record in group:
+            print_job(provider, record.job, verbose=True)
+    return True
+
+def delete_job_by_id(provider: CronProvider, job_id: str) -> bool:
+    """Удаляет задание по ID из командной строки (хранилище обновляет delete_job)"""
+    if not provider.api_key:
+        print(f"❌ Не установлена переменная {provider.api_key_env}")
+        return False
+    # В хранилище ID провайдеров - числа из JSON
+    return provider.delete_job(int(job_id) if job_id.isdigit() else job_id)
+
+def audit_jobs(provider: CronProvider):
+    """Сверяет локальное хранилище со списком заданий провайдера"""
+    if not provider.validate_environment():
+        return False
+
+    jobs = fetch_jobs(provider, audit=True)
+    if jobs is None:
+        return False
+
+    print(f"🔎 Хранилище сверено с {provider.display_name}: {len(jobs)} заданий")
+    return True
+
+def cleanup_old_jobs(provider: CronProvider, concurrency: int = DEFAULT_CONCURRENCY):
+    """
+    Удаляет старые задания Floating Island у провайдера
+    Возвращает BulkDeleteResult (удалены, ошибки, пропущенные Checker) или False
+    """
+    if not provider.validate_environment():
+        return False
+
+    # Получаем список всех заданий
+    jobs = fetch_jobs(provider)
+    if jobs is None:
+        return False
+
+    print(f"📋 Найдено {len(jobs)} заданий. Анализируем...")
+
+    # Основные задания Checker не трогаем, одноразовые удаляем параллельно
+    to_delete, skipped = select_cleanup_jobs(provider.job_pairs(jobs))
+    result = provider.delete_jobs(to_delete, concurrency, skipped=skipped)
+
+    print(f"✅ Очистка завершена. Удалено {len(result.deleted)}, ошибок {len(result.failed)}, "
+          f"пропущено основных {len(result.skipped)}")
+    return result
+
+def schedule_floating_island_sequence(provider: CronProvider, start_date: datetime = None, count: int = 30,
+                                      recreate: bool = False, concurrency: int = DEFAULT_CONCURRENCY):
+    """
+    Планирует последовательность уведомлений Floating Island у провайдера
+    По умолчанию сверяет существующие задания с расписанием и создает/удаляет только разницу.
+    recreate=True - старое поведение: удалить все задания и создать заново.
+    Задания создаются параллельно (не более concurrency одновременных запросов)
+    """
+    try:
+        from floating_island_bot import iter_events
+    except ImportError:
+        print("❌ Не удалось импортировать floating_island_bot")
+        return False
+
+    if not provider.validate_environment():
+        return False
+
+    if not start_date:
+        start_date = datetime.now(pytz.UTC)
+
+    print(f"📅 Планируем {count} уведомлений Floating Island через {provider.display_name}")
+    print(f"⏰ Начиная с: {start_date.strftime('%d.%m.%Y %H:%M')} UTC")
+    print("=" * 60)
+
+    # Получаем события для планирования, пропуская события в прошлом
+    events = {}
+    skipped_count = 0
+    for event in islice(iter_events(start_date), count):
+        if event['notification_time'] <= start_date:
+            skipped_count += 1
+            continue
+        events[event['notification_time']] = event
+
+    if recreate:
+        # Сначала очищаем старые задания
+        print("🧹 Очищаем старые задания...")
+        cleanup_old_jobs(provider, concurrency)
+        print()
+        existing_jobs = []
+    else:
+        # Один запрос списка заданий вместо очистки и пересоздания
+        print("🔍 Сверяем существующие задания с расписанием...")
+        jobs = fetch_jobs(provider)
+        if jobs is None:
+            return False
+        existing_jobs = provider.job_pairs(jobs)
+
+    plan = plan_reconciliation(existing_jobs, events)
+
+    print(f"✔️ Уже запланировано: {len(plan.unchanged)}")
+    print(f"➕ Нужно создать: {len(plan.to_create)}")
+    print(f"➖ Нужно удалить: {len(plan.to_delete)}")
+
+    if not plan.to_create and not plan.to_delete:
+        print(f"\n🎉 Расписание {provider.display_name} уже актуально, изменения не требуются")
+        return True
+
+    # Запросы идут так быстро, как позволяет лимитер провайдера
+    deleted_count = len(provider.delete_jobs(plan.to_delete, concurrency).deleted)
+
+    # Не выходим за квоты провайдера (1 запрос списка + удаления + создания)
+    allowed = provider.check_quota(
+        existing_jobs=len(existing_jobs) - deleted_count,
+        to_create=len(plan.to_create),
+        requests_planned=1 + len(plan.to_delete) + len(plan.to_create)
+    )
+    to_create = plan.to_create[:allowed]
+
+    scheduled_count = 0
+    failed_count = 0
+    total = len(to_create)
+
+    print(f"📊 Создаем {total} заданий (одновременно до {concurrency})...")
+    print("-" * 60)
+
+    job_ids = provider.create_jobs(to_create, concurrency)
+
+    # Отчет по каждому событию в порядке расписания
+    for i, (notification_time, job_id) in enumerate(zip(to_create, job_ids), 1):
+        event_start = events[notification_time]['event_start']
+
+        print(f"\n📌 Планируем событие {i}/{total}:")
+        print(f"   📢 Уведомление: {notification_time.strftime('%d.%m.%Y %H:%M')} UTC")
+        print(f"   🎈 Событие: {event_start.strftime('%d.%m.%Y %H:%M')} UTC")
+
+        # Вычисляем время до уведомления
+        time_until = (notification_time - start_date).total_seconds()
+        hours_until = int(time_until // 3600)
+        print(f"   ⏰ Через: {hours_until} часов")
+
+        if job_id:
+            scheduled_count += 1
+            print(f"   ✅ Запланировано ({provider.display_name} ID: {job_id})")
+        else:
+            failed_count += 1
+            print(f"   ❌ Ошибка планирования")
+
+    print(f"\n" + "=" * 60)
+    print(f"📊 ИТОГИ ПЛАНИРОВАНИЯ {provider.display_name.upper()}:")
+    print(f"✅ Успешно запланировано: {scheduled_count}")
+    print(f"✔️ Уже было запланировано: {len(plan.unchanged)}")
+    print(f"🗑️ Удалено лишних: {deleted_count}")
+    print(f"❌ Ошибок: {failed_count}")
+    print(f"⏭️ Пропущено (прошлые): {skipped_count}")
+    print(f"📋 Обработано событий: {count}")
+
+    if scheduled_count > 0 or plan.unchanged:
+        print(f"\n🎉 Система готова к работе!")
+        print(f"📱 Уведомления будут отправляться автоматически")
+        return True
+    else:
+        print(f"\n⚠️ Не удалось запланировать ни одного события")
+        return False
+
+def print_job(provider: CronProvider, job, verbose: bool = False):
+    """Строка задания для list; у FastCron дополнительно cron-выражение"""
+    enabled = provider.job_enabled(job)
+    if verbose:
+        status = "🟢 Активно" if enabled else "🔴 Отключено"
+    else:
+        status = "🟢" if enabled else "🔴"
+    print(f"  {status} {provider.job_title(job) or 'Без названия'} (ID: {provider.job_id(job)})")
+    if job.get('expression'):
+        print(f"    Cron: {job['expression']}")
+
+def get_scheduled_jobs(provider: CronProvider):
+    """
+    Показывает все запланированные задания Floating Island у провайдера
+    """
+    if not provider.validate_environment():
+        return
+
+    jobs = fetch_jobs(provider)
+    if jobs is None:
+        return
+
+    floating_jobs = [job for job in jobs if 'Floating Island' in provider.job_title(job)]
+
+    if not floating_jobs:
+        print(f"📭 Нет запланированных заданий Floating Island в {provider.display_name}")
+        return
+
+    print(f"📋 Найдено {len(floating_jobs)} заданий Floating Island в {provider.display_name}:")
+    print("=" * 80)
+
+    # Разделяем на категории
+    checker_jobs = []
+    scheduled_jobs = []
+
+    for job in floating_jobs:
+        if 'Checker' in provider.job_title(job):
+            checker_jobs.append(job)
+        else:
+            scheduled_jobs.append(job)
+
+    # Показываем основные задания
+    if checker_jobs:
+        print("🔄 ОСНОВНЫЕ ЗАДАНИЯ (постоянные):")
+        for job in checker_jobs:
+            print_job(provider, job, verbose=True)
+        print()
+
+    # Показываем запланированные уведомления
+    if scheduled_jobs:
+        print("📅 ЗАПЛАНИРОВАННЫЕ УВЕДОМЛЕНИЯ:")
+
+        # Сортируем по времени срабатывания, а не по строке названия
+        now = datetime.now(pytz.UTC)
+        scheduled_jobs.sort(key=lambda job: provider.job_fire_time(job, now) or datetime.max.replace(tzinfo=pytz.UTC))
+
+        for job in scheduled_jobs[:SHOWN_JOBS]:
+            print_job(provider, job)
+
+        if len(scheduled_jobs) > SHOWN_JOBS:
+            print(f"  ... и еще {len(scheduled_jobs) - SHOWN_JOBS} заданий")
+
+    print(f"\n📊 ВСЕГО {provider.display_name.upper()}: {len(floating_jobs)} заданий")
+
+def test_connections(provider: CronProvider, setup_module: str, connection_test: str):
+    """Проверяет подключение к провайдеру и GitHub функциями из setup_module"""
+    print(f"🔧 ТЕСТИРОВАНИЕ {provider.display_name.upper()} СИСТЕМЫ")
+    print("=" * 50)
+    if not provider.validate_environment():
+        return
+    try:
+        module = importlib.import_module(setup_module)
+    except ImportError:
+        print(f"⚠️ Модуль {setup_module} недоступен для тестирования")
+        return
+    getattr(module, connection_test)()
+    module.test_github_connection()
+
+def main(provider: CronProvider, script: str, setup_module: str, connection_test: str):
+    """Основная функция с CLI интерфейсом; script - имя скрипта для справки"""
+    if len(sys.argv) < 2:
+        print(f"📅 {provider.display_name.upper()} SCHEDULER - Планировщик заданий Floating Island")
+        print("=" * 60)
+        print("Использование:")
+        print(f"  python {script} schedule [количество] [--recreate] [--concurrency=N] - запланировать события (по умолчанию 30)")
+        print(f"  python {script} list                   - показать запланированные задания")
+        print(f"  python {script} cleanup                - очистить старые задания")
+        print(f"  python {script} audit                  - сверить локальное хранилище с {provider.display_name}")
+        print(f"  python {script} test                   - тестировать подключения")
+        print()
+        print("Примеры:")
+        print(f"  python {script} schedule 50    # Запланировать 50 событий")
+        print(f"  python {script} schedule       # Запланировать 30 событий")
+        return
+
+    command = sys.argv[1].lower()
+
+    if command == 'schedule':
+        count = 30
+        # --recreate: удалить все задания и создать заново вместо сверки
+        recreate = '--recreate' in sys.argv
+        # --concurrency=N: сколько заданий создавать одновременно
+        concurrency = DEFAULT_CONCURRENCY
+        for arg in sys.argv[2:]:
+            if arg.startswith('--concurrency='):
+                try:
+                    concurrency = max(1, int(arg.split('=', 1)[1]))
+                except ValueError:
+                    print("❌ Некорректное значение --concurrency. Используйте целое число")
+                    return
+        args = [arg for arg in sys.argv[2:] if not arg.startswith('--')]
+        if args:
+            try:
+                count = int(args[0])
+                if count <= 0 or count > 100:
+                    print("❌ Количество должно быть от 1 до 100")
+                    return
+            except ValueError:
+                print("❌ Некорректное количество. Используйте число от 1 до 100")
+                return
+
+        print(f"🚀 Запускаем планирование {count} событий через {provider.display_name}...")
+        schedule_floating_island_sequence(provider, count=count, recreate=recreate, concurrency=concurrency)
+
+    elif command == 'list':
+        get_scheduled_jobs(provider)
+
+    elif command == 'cleanup':
+        print(f"🧹 Запускаем очистку старых заданий {provider.display_name}...")
+        cleanup_old_jobs(provider)
+
+    elif command == 'audit':
+        audit_jobs(provider)
+
+    elif command == 'test':
+        test_connections(provider, setup_module, connection_test)
+
+    else:
+        print("❌ Неизвестная команда. Используйте: schedule, list, cleanup, audit, test")
\ No newline at end of file
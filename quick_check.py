@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Быстрая предварительная проверка для задания "Notifications Checker"
+Только стандартная библиотека и целочисленная арифметика на секундах эпохи:
+решение принимается за миллисекунды, а floating_island_bot (requests, pytz и остальное)
+импортируется, только если уведомление действительно нужно отправить.
+Константы повторяют расписание floating_island_bot
+
+Запуск: python quick_check.py [--check-only] [--at=<секунды эпохи>]
+"""
+
+import time
+
+_started = time.perf_counter()
+
+import os
+import sys
+
+BASE_EVENT_EPOCH = 1755619200  # 19.08.2025 16:00 UTC, BASE_EVENT_TIME
+EVENT_INTERVAL = 30000  # 8 ч 20 мин, EVENT_INTERVAL
+NOTIFICATION_ADVANCE = 0  # NOTIFICATION_ADVANCE
+NOTIFICATION_TOLERANCE = 300  # ±5 минут, NOTIFICATION_TOLERANCE
+
+def due_event_index(now: int) -> int:
+    """
+    Индекс события, уведомление о котором попадает в окно проверки вокруг now, или None
+    now - целые секунды эпохи; окно на секунду шире сверху, чтобы отброшенная
+    дробная часть не привела к пропуску - точную проверку делает основной путь
+    """
+    # notification_time(i) = BASE_EVENT_EPOCH + i * EVENT_INTERVAL - NOTIFICATION_ADVANCE
+    earliest = now - NOTIFICATION_TOLERANCE + NOTIFICATION_ADVANCE - BASE_EVENT_EPOCH
+    index = max(-(-earliest // EVENT_INTERVAL), 0)
+    notification_time = BASE_EVENT_EPOCH + index * EVENT_INTERVAL - NOTIFICATION_ADVANCE
+    if notification_time <= now + 1 + NOTIFICATION_TOLERANCE:
+        return index
+    return None
+
+def report_github_output(due: bool):
+    """Передает решение следующим шагам workflow (steps.<id>.outputs.due)"""
+    path = os.environ.get('GITHUB_OUTPUT')
+    if not path:
+        return
+    try:
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(f"due={'true' if due else 'false'}\n")
+    except OSError as e:
+        print(f"⚠️ Не удалось записать GITHUB_OUTPUT: {e}")
+
+def main():
+    """Решает, нужен ли основной путь, и запускает его только при необходимости"""
+    args = sys.argv[1:]
+    check_only = '--check-only' in args
+    now = time.time_ns() // 1_000_000_000
+    for arg in args:
+        if arg.startswith('--at='):
+            now = int(arg.split('=', 1)[1])
+
+    index = due_event_index(now)
+    decided_ms = (time.perf_counter() - _started) * 1000
+    report_github_output(index is not None)
+
+    if index is None:
+        print(f"📭 Нет событий для уведомления (решение за {decided_ms:.2f} мс, без основного модуля)")
+        return 0
+
+    print(f"🚨 Событие {index} в окне проверки (решение за {decided_ms:.2f} мс)")
+    if check_only:
+        return 0
+
+    # Тяжелый путь: отправка и планирование следующего уведомления
+    import_started = time.perf_counter()
+    import floating_island_bot
+    print(f"📦 Основной модуль загружен за {(time.perf_counter() - import_started) * 1000:.0f} мс")
+
+    sys.argv = sys.argv[:1]
+    floating_island_bot.main()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Адаптивное ограничение частоты запросов к cron-провайдерам
+Token bucket с AIMD: после каждого успешного запроса скорость плавно растет,
+при 429 - уменьшается вдвое. Заголовки Retry-After и X-RateLimit-*/RateLimit-*
+учитываются, если провайдер их присылает
+"""
+
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+# Стартовые настройки по провайдерам (запросов в секунду)
+PROVIDER_LIMITS = {
+    'cron-job.org': {
+        'hosts': ('api.cron-job.org',),
+        'rate': 0.5,
+        'min_rate': 0.02,
+        'max_rate': 2.0,
+        'burst': 2,
+        'increase': 0.05
+    },
+    'fastcron': {
+        'hosts': ('app.fastcron.com', 'www.fastcron.com', 'fastcron.com'),
+        'rate': 2.0,
+        'min_rate': 0.1,
+        'max_rate': 10.0,
+        'burst': 5,
+        'increase': 0.2
+    }
+}
+
+class RateLimiter:
+    """Token bucket с аддитивным ростом и мультипликативным снижением скорости (AIMD)"""
+
+    def __init__(self, name: str, rate: float, min_rate: float, max_rate: float,
+                 burst: int = 1, increase: float = 0.1, decrease: float = 0.5):
+        self.name = name
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self.increase = increase
+        self.decrease = decrease
+
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+        self.requests = 0
+        self.throttled = 0
+        self.waited = 0.0
+
+    def _refill(self, now: float):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self) -> float:
+        """Ждет свободный токен; возвращает время ожидания в секундах"""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now < self._paused_until:
+                    delay = self._paused_until - now
+                elif self._tokens >= 1:
+                    self._tokens -= 1
+                    self.requests += 1
+                    self.waited += waited
+                    return waited
+                else:
+                    delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+    def pause(self, seconds: float):
+        """Запрещает запросы на seconds секунд (например, по Retry-After)"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = min(self._tokens, 0.0)
+
+    def on_success(self):
+        """Аддитивное увеличение скорости после успешного запроса"""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def on_throttled(self, retry_after: float = None):
+        """Мультипликативное снижение скорости после 429"""
+        with self._lock:
+            self.throttled += 1
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+        # Без Retry-After ждем хотя бы один интервал новой скорости
+        self.pause(retry_after if retry_after is not None else 1 / self.rate)
+
+    def observe(self, status_code: int, headers) -> float:
+        """
+        Учитывает ответ провайдера: статус и заголовки лимитов
+        Возвращает паузу из Retry-After (или None)
+        """
+        retry_after = parse_retry_after(headers.get('Retry-After'))
+
+        if status_code == 429:
+            self.on_throttled(retry_after)
+        else:
+            self.on_success()
+            if retry_after is not None:
+                self.pause(retry_after)
+
+        # Лимит исчерпан - ждем до сброса окна
+        remaining = _get_header(headers, 'X-RateLimit-Remaining', 'RateLimit-Remaining')
+        reset = _get_header(headers, 'X-RateLimit-Reset', 'RateLimit-Reset')
+        if remaining is not None and reset is not None:
+            try:
+                if int(float(remaining)) <= 0:
+                    self.pause(_reset_delay(float(reset)))
+            except ValueError:
+                pass
+
+        return retry_after
+
+    def stats(self) -> str:
+        """Короткая строка со статистикой лимитера"""
+        return (f"{self.name}: {self.requests} запр., 429: {self.throttled}, "
+                f"ожидание {self.waited:.1f} сек, скорость {self.rate:.2f} запр/сек")
+
+def parse_retry_after(value) -> float:
+    """Разбирает Retry-After: число секунд или HTTP-дата"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+        return max(0.0, retry_at.timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+def _get_header(headers, *names):
+    for name in names:
+        value = headers.get(name)
+        if value is not None:
+            return value
+    return None
+
+def _reset_delay(reset: float) -> float:
+    """Reset бывает временем в epoch (GitHub) или количеством секунд (RateLimit-Reset)"""
+    if reset > 10 ** 9:
+        return max(0.0, reset - time.time())
+    return max(0.0, reset)
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+def get_limiter(provider: str) -> RateLimiter:
+    """Возвращает общий для процесса лимитер провайдера"""
+    with _limiters_lock:
+        limiter = _limiters.get(provider)
+        if limiter is None:
+            settings = dict(PROVIDER_LIMITS[provider])
+            settings.pop('hosts')
+            limiter = _limiters[provider] = RateLimiter(provider, **settings)
+        return limiter
+
+def get_limiter_for_url(url: str) -> RateLimiter:
+    """Лимитер провайдера, которому принадлежит url (None для остальных хостов)"""
+    host = urlsplit(url).hostname or ''
+    for provider, settings in PROVIDER_LIMITS.items():
+        if host in settings['hosts']:
+            return get_limiter(provider)
+    return None
+
+def get_limiters():
+    """Все созданные в процессе лимитеры"""
+    with _limiters_lock:
+        return list(_limiters.values())
\ No newline at end of file
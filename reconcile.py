@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Сверка заданий у провайдера с нужным расписанием
+Вместо удаления всех заданий и создания их заново вычисляется разница:
+какие задания нужно создать, а какие удалить
+"""
+
+import re
+from datetime import datetime
+from typing import NamedTuple
+
+JOB_TITLE_PREFIX = 'Floating Island'
+
+class ReconcilePlan(NamedTuple):
+    """Результат сверки существующих заданий с нужным расписанием"""
+    to_create: list  # Время уведомлений, для которых нет задания
+    to_delete: list  # (job_id, title) лишних и устаревших заданий
+    unchanged: list  # (job_id, title) заданий, которые уже совпадают с расписанием
+
+def notification_job_title(notification_time: datetime) -> str:
+    """Название одноразового задания для уведомления"""
+    return f"{JOB_TITLE_PREFIX} {notification_time.strftime('%d.%m %H:%M')} UTC"
+
+def parse_notification_job_title(title: str, now: datetime):
+    """
+    Время уведомления по названию одноразового задания; None для остальных заданий
+    В названии нет года - берется год, при котором время ближе всего к now
+    """
+    if not is_notification_job(title):
+        return None
+    match = re.search(r'(\d{2})\.(\d{2}) (\d{2}):(\d{2}) UTC', title)
+    if not match:
+        return None
+
+    day, month, hour, minute = (int(value) for value in match.groups())
+    return nearest_moment(now, month, day, hour, minute)
+
+def nearest_moment(now: datetime, month: int, day: int, hour: int, minute: int):
+    """Ближайший к now момент с такими месяцем, днем и временем (в cron и названиях нет года)"""
+    candidates = []
+    for year in (now.year - 1, now.year, now.year + 1):
+        try:
+            candidates.append(now.replace(year=year, month=month, day=day, hour=hour, minute=minute,
+                                          second=0, microsecond=0))
+        except ValueError:
+            continue  # 29.02 в невисокосном году или значение вне диапазона
+    return min(candidates, key=lambda moment: abs(moment - now), default=None)
+
+def is_notification_job(title: str) -> bool:
+    """Одноразовое задание уведомления (не основное задание Checker)"""
+    return JOB_TITLE_PREFIX in title and 'Checker' not in title
+
+def plan_reconciliation(existing_jobs, desired_times) -> ReconcilePlan:
+    """
+    Сравнивает существующие задания (пары job_id, title) с нужными временами уведомлений
+    Задания сопоставляются по названию, которое однозначно задает время уведомления
+    """
+    desired = {notification_job_title(t): t for t in desired_times}
+
+    to_delete = []
+    unchanged = []
+    for job_id, title in existing_jobs:
+        if not job_id or not is_notification_job(title):
+            continue
+        if title in desired:
+            # Первое задание с таким названием оставляем, дубликаты удаляем
+            unchanged.append((job_id, title))
+            del desired[title]
+        else:
+            to_delete.append((job_id, title))
+
+    return ReconcilePlan(
+        to_create=sorted(desired.values()),
+        to_delete=to_delete,
+        unchanged=unchanged
+    )
\ No newline at end of file
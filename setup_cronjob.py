@@ -2,12 +2,14 @@
 # -*- coding: utf-8 -*-
 
 import os
-import requests
+import http_client
 import json
-import time
-from datetime import datetime, timedelta
+from datetime import datetime
 import pytz
 
+from cron_providers import CronJobOrgProvider
+import provider_scheduler
+
 # API настройки для cron-job.org
 CRONJOB_API_KEY = os.environ.get('CRONJOB_API_KEY')
 CRONJOB_BASE_URL = 'https://api.cron-job.org'
@@ -17,6 +19,9 @@ CRONJOB_BASE_URL = 'https://api.cron-job.org'
 WEBHOOK_URL = os.environ.get('WEBHOOK_URL')
 GITHUB_TOKEN = os.environ.get('GH_TOKEN')
 
+# Создание и удаление заданий уведомлений - через общий провайдер
+PROVIDER = CronJobOrgProvider()
+
 def validate_environment():
     """Проверяет настройки переменных окружения"""
     errors = []
@@ -53,7 +58,7 @@ def test_cronjob_connection():
     }
     
     try:
-        response = requests.get(f"{CRONJOB_BASE_URL}/jobs", headers=headers, timeout=10)
+        response = http_client.get(f"{CRONJOB_BASE_URL}/jobs", headers=headers, timeout=10)
         
         if response.status_code == 200:
             print("✅ Подключение к cron-job.org API успешно")
@@ -89,7 +94,7 @@ def test_github_connection():
     }
     
     try:
-        response = requests.post(WEBHOOK_URL, headers=headers, json=test_payload, timeout=10)
+        response = http_client.post(WEBHOOK_URL, headers=headers, json=test_payload, timeout=10)
         
         if response.status_code == 204:
             print("✅ Подключение к GitHub API успешно")
@@ -111,100 +116,12 @@ def test_github_connection():
 
 def create_single_notification_job(notification_time: datetime, retry_count: int = 3):
     """
-    Создает одно точное задание для уведомления в указанное время
-    С улучшенной обработкой rate limiting и ошибок
+    Создает одно точное задание для уведомления в указанное время через CronJobOrgProvider
+    (упреждение на задержку запуска и запись в локальное хранилище делает провайдер)
     """
     if not validate_environment():
         return False
-    
-    # Форматируем время для cron
-    minute = notification_time.minute
-    hour = notification_time.hour
-    day = notification_time.day
-    month = notification_time.month
-    
-    title = f"Floating Island {notification_time.strftime('%d.%m %H:%M')} UTC"
-    
-    headers = {
-        'Authorization': f'Bearer {CRONJOB_API_KEY}',
-        'Content-Type': 'application/json'
-    }
-    
-    job_data = {
-        'job': {
-            'url': WEBHOOK_URL,
-            'enabled': True,
-            'title': title,
-            'schedule': {
-                'timezone': 'UTC',
-                'hours': [hour],
-                'minutes': [minute],
-                'mdays': [day],
-                'months': [month],
-                'wdays': [-1]
-            },
-            'requestMethod': 1,  # POST
-            'requestHeaders': [
-                {
-                    'name': 'Authorization',
-                    'value': f'token {GITHUB_TOKEN}'
-                },
-                {
-                    'name': 'Accept',
-                    'value': 'application/vnd.github.v3+json'
-                },
-                {
-                    'name': 'Content-Type',
-                    'value': 'application/json'
-                }
-            ],
-            'requestBody': json.dumps({
-                'ref': 'main',
-                'inputs': {
-                    'action': 'notify'
-                }
-            })
-        }
-    }
-    
-    for attempt in range(retry_count):
-        try:
-            response = requests.put(
-                f"{CRONJOB_BASE_URL}/jobs",
-                headers=headers,
-                json=job_data,
-                timeout=30
-            )
-            
-            if response.status_code in [200, 201]:
-                result = response.json()
-                job_id = result.get('jobId')
-                print(f"✅ Автопланирование: задание создано (ID: {job_id})")
-                print(f"🕐 Время: {notification_time.strftime('%d.%m.%Y %H:%M')} UTC")
-                return job_id
-            elif response.status_code == 429:
-                # Rate limiting - увеличиваем время ожидания
-                wait_time = (attempt + 1) * 25  # 25, 50, 75 секунд
-                print(f"⏳ Rate limit (попытка {attempt + 1}/{retry_count}). Ждем {wait_time} сек...")
-                time.sleep(wait_time)
-                continue
-            elif response.status_code == 401:
-                print(f"❌ Ошибка аутентификации cron-job.org. Проверьте API ключ")
-                return False
-            else:
-                print(f"❌ Ошибка автопланирования: {response.status_code}")
-                print(f"Ответ: {response.text}")
-                return False
-                
-        except Exception as e:
-            print(f"❌ Исключение автопланирования (попытка {attempt + 1}): {e}")
-            if attempt < retry_count - 1:
-                time.sleep(5)
-                continue
-            return False
-    
-    print(f"❌ Не удалось создать задание после {retry_count} попыток")
-    return False
+    return PROVIDER.create_job(notification_time, retry_count=retry_count)
 
 def create_cronjob_schedule():
     """
@@ -268,7 +185,7 @@ def create_cronjob_schedule():
     }
     
     try:
-        response = requests.put(
+        response = http_client.put(
             f"{CRONJOB_BASE_URL}/jobs",
             headers=headers,
             json=job_data,
@@ -293,90 +210,12 @@ def create_cronjob_schedule():
         return False
 
 def list_existing_jobs():
-    """Показывает существующие задания с улучшенным форматированием"""
-    if not CRONJOB_API_KEY:
-        print("❌ Не установлена переменная CRONJOB_API_KEY")
-        return
-    
-    headers = {
-        'Authorization': f'Bearer {CRONJOB_API_KEY}',
-        'Content-Type': 'application/json'
-    }
-    
-    try:
-        response = requests.get(f"{CRONJOB_BASE_URL}/jobs", headers=headers, timeout=30)
-        
-        if response.status_code == 200:
-            jobs = response.json().get('jobs', [])
-            print(f"📋 Найдено {len(jobs)} заданий:")
-            print("=" * 80)
-            
-            floating_jobs = []
-            other_jobs = []
-            
-            for job in jobs:
-                if 'Floating Island' in job.get('title', ''):
-                    floating_jobs.append(job)
-                else:
-                    other_jobs.append(job)
-            
-            if floating_jobs:
-                print(f"🎈 Floating Island задания ({len(floating_jobs)}):")
-                for job in floating_jobs:
-                    job_id = job.get('jobId')
-                    title = job.get('title', 'Без названия')
-                    enabled = job.get('enabled', False)
-                    
-                    status = "🟢 Активно" if enabled else "🔴 Отключено"
-                    print(f"  {status} ID: {job_id} - {title}")
-            
-            if other_jobs:
-                print(f"\n📌 Другие задания ({len(other_jobs)}):")
-                for job in other_jobs:
-                    job_id = job.get('jobId')
-                    title = job.get('title', 'Без названия')
-                    enabled = job.get('enabled', False)
-                    
-                    status = "🟢 Активно" if enabled else "🔴 Отключено"
-                    print(f"  {status} ID: {job_id} - {title}")
-                
-        elif response.status_code == 401:
-            print("❌ Неверный API ключ cron-job.org")
-        else:
-            print(f"❌ Ошибка получения списка: {response.status_code}")
-            print(f"Ответ: {response.text}")
-            
-    except Exception as e:
-        print(f"❌ Исключение при получении списка: {e}")
+    """Показывает все задания cron-job.org: Floating Island и остальные"""
+    provider_scheduler.list_all_jobs(PROVIDER)
 
 def delete_job(job_id: str):
-    """Удаляет задание по ID с подтверждением"""
-    if not CRONJOB_API_KEY:
-        print("❌ Не установлена переменная CRONJOB_API_KEY")
-        return False
-    
-    headers = {
-        'Authorization': f'Bearer {CRONJOB_API_KEY}',
-        'Content-Type': 'application/json'
-    }
-    
-    try:
-        response = requests.delete(f"{CRONJOB_BASE_URL}/jobs/{job_id}", headers=headers, timeout=30)
-        
-        if response.status_code == 200:
-            print(f"✅ Задание {job_id} удалено успешно")
-            return True
-        elif response.status_code == 404:
-            print(f"❌ Задание {job_id} не найдено")
-            return False
-        else:
-            print(f"❌ Ошибка удаления задания: {response.status_code}")
-            print(f"Ответ: {response.text}")
-            return False
-            
-    except Exception as e:
-        print(f"❌ Исключение при удалении задания: {e}")
-        return False
+    """Удаляет задание по ID (и из локального хранилища)"""
+    return provider_scheduler.delete_job_by_id(PROVIDER, job_id)
 
 def main():
     """Основная функция с CLI интерфейсом"""
@@ -2,12 +2,14 @@
 # -*- coding: utf-8 -*-
 
 import os
-import requests
+import http_client
 import json
-import time
-from datetime import datetime, timedelta
+from datetime import datetime
 import pytz
 
+from cron_providers import FastCronProvider
+import provider_scheduler
+
 # API настройки для FastCron.com
 FASTCRON_API_KEY = os.environ.get('FASTCRON_API_KEY')
 FASTCRON_BASE_URL = 'https://app.fastcron.com/api'
@@ -17,6 +19,9 @@ FASTCRON_BASE_URL = 'https://app.fastcron.com/api'
 WEBHOOK_URL = os.environ.get('WEBHOOK_URL')
 GITHUB_TOKEN = os.environ.get('GH_TOKEN')
 
+# Создание и удаление заданий уведомлений - через общий провайдер
+PROVIDER = FastCronProvider()
+
 
 def validate_environment():
     """Проверяет настройки переменных окружения"""
@@ -77,7 +82,7 @@ def test_fastcron_connection():
     
     try:
         # Используем правильный эндпоинт FastCron с POST запросом
-        response = requests.post(
+        response = http_client.post(
             f"{FASTCRON_BASE_URL}/v1/cron_list",
             json={'token': FASTCRON_API_KEY},
             timeout=10
@@ -143,7 +148,7 @@ def test_github_connection():
     }
     
     try:
-        response = requests.post(github_url, headers=headers, json=test_payload, timeout=10)
+        response = http_client.post(github_url, headers=headers, json=test_payload, timeout=10)
         
         if response.status_code == 204:
             print("✅ Подключение к GitHub API успешно")
@@ -168,106 +173,12 @@ def test_github_connection():
 
 def create_single_notification_job(notification_time: datetime, retry_count: int = 3):
     """
-    Создает одно точное задание для уведомления в указанное время в FastCron
+    Создает одно точное задание для уведомления в указанное время через FastCronProvider
+    (упреждение на задержку запуска и запись в локальное хранилище делает провайдер)
     """
     if not validate_environment():
         return False
-    
-    # Извлекаем owner и repo из WEBHOOK_URL для формирования правильного URL
-    try:
-        if WEBHOOK_URL.startswith('https://api.github.com/repos/'):
-            url_parts = WEBHOOK_URL.replace('https://api.github.com/repos/', '').split('/')
-            if len(url_parts) >= 2:
-                owner, repo = url_parts[0], url_parts[1]
-                # Новый формат URL для dispatches
-                github_dispatch_url = f"https://api.github.com/repos/{owner}/{repo}/actions/workflows/184853159/dispatches"
-            else:
-                print("❌ Неправильный формат WEBHOOK_URL")
-                return False
-        else:
-            print("❌ WEBHOOK_URL должен начинаться с https://api.github.com/repos/")
-            return False
-    except Exception as e:
-        print(f"❌ Ошибка разбора WEBHOOK_URL: {e}")
-        return False
-    
-    # FastCron использует стандартный cron формат
-    minute = notification_time.minute
-    hour = notification_time.hour
-    day = notification_time.day
-    month = notification_time.month
-    
-    # Создаем cron выражение для конкретной даты/времени
-    cron_expression = f"{minute} {hour} {day} {month} *"
-    
-    title = f"Floating Island {notification_time.strftime('%d.%m %H:%M')} UTC"
-    
-    # Подготавливаем POST данные для GitHub webhook (новый формат)
-    post_data = json.dumps({
-        "event_type": "floating_island_notification",
-        "client_payload": {
-            "notification_time": notification_time.isoformat(),
-            "auto_scheduled": True
-        },
-        "ref": "main"
-    })
-    
-    # HTTP заголовки для GitHub API
-    http_headers = f"Authorization: token {GITHUB_TOKEN}\\r\\nAccept: application/vnd.github.v3+json\\r\\nContent-Type: application/json"
-    
-    # Параметры для FastCron API (используем POST с правильным форматом)
-    payload = {
-        'token': FASTCRON_API_KEY,
-        'name': title,
-        'expression': cron_expression,
-        'url': github_dispatch_url,  # Используем правильный URL
-        'httpMethod': 'POST',
-        'postData': post_data,
-        'httpHeaders': http_headers,
-        'timezone': 'UTC',
-        'notify': 'false'  # Отключаем уведомления о сбоях
-    }
-    
-    for attempt in range(retry_count):
-        try:
-            response = requests.post(
-                f"{FASTCRON_BASE_URL}/v1/cron_add",
-                json=payload,
-                timeout=30
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                if result.get('status') == 'success':
-                    job_data = result.get('data', {})
-                    job_id = job_data.get('id')
-                    print(f"✅ FastCron задание создано (ID: {job_id})")
-                    print(f"🕐 Время: {notification_time.strftime('%d.%m.%Y %H:%M')} UTC")
-                    print(f"⚙️ Cron: {cron_expression}")
-                    return job_id
-                else:
-                    error_msg = result.get('message', 'Неизвестная ошибка')
-                    print(f"❌ Ошибка FastCron: {error_msg}")
-                    return False
-            elif response.status_code == 429:
-                # Rate limiting - FastCron имеет более мягкие ограничения
-                wait_time = (attempt + 1) * 5  # 5, 10, 15 секунд
-                print(f"⏳ Rate limit FastCron (попытка {attempt + 1}/{retry_count}). Ждем {wait_time} сек...")
-                time.sleep(wait_time)
-                continue
-            else:
-                print(f"❌ Ошибка HTTP {response.status_code}: {response.text}")
-                return False
-                
-        except Exception as e:
-            print(f"❌ Исключение FastCron (попытка {attempt + 1}): {e}")
-            if attempt < retry_count - 1:
-                time.sleep(3)
-                continue
-            return False
-    
-    print(f"❌ Не удалось создать задание FastCron после {retry_count} попыток")
-    return False
+    return PROVIDER.create_job(notification_time, retry_count=retry_count)
 
 def create_fastcron_schedule():
     """
@@ -310,7 +221,7 @@ def create_fastcron_schedule():
     }
     
     try:
-        response = requests.post(
+        response = http_client.post(
             f"{FASTCRON_BASE_URL}/v1/cron_add",
             json=payload,
             timeout=30
@@ -339,96 +250,12 @@ def create_fastcron_schedule():
         return False
 
 def list_existing_jobs():
-    """Показывает существующие задания FastCron"""
-    if not FASTCRON_API_KEY:
-        print("❌ Не установлена переменная FASTCRON_API_KEY")
-        return
-    
-    try:
-        response = requests.get(
-            f"{FASTCRON_BASE_URL}/v1/cron_list",
-            params={'token': FASTCRON_API_KEY},
-            timeout=30
-        )
-        
-        if response.status_code == 200:
-            result = response.json()
-            if result.get('status') == 'success':
-                crons = result.get('data', [])
-                print(f"📋 Найдено {len(crons)} заданий FastCron:")
-                print("=" * 80)
-                
-                floating_jobs = []
-                other_jobs = []
-                
-                for cron in crons:
-                    if 'Floating Island' in cron.get('name', ''):
-                        floating_jobs.append(cron)
-                    else:
-                        other_jobs.append(cron)
-                
-                if floating_jobs:
-                    print(f"🎈 Floating Island задания ({len(floating_jobs)}):")
-                    for job in floating_jobs:
-                        job_id = job.get('id')
-                        name = job.get('name', 'Без названия')
-                        status = job.get('status', 0)
-                        expression = job.get('expression', '')
-                        
-                        status_text = "🟢 Активно" if status == 1 else "🔴 Отключено"
-                        print(f"  {status_text} ID: {job_id} - {name}")
-                        print(f"    Cron: {expression}")
-                
-                if other_jobs:
-                    print(f"\n📌 Другие задания ({len(other_jobs)}):")
-                    for job in other_jobs:
-                        job_id = job.get('id')
-                        name = job.get('name', 'Без названия')
-                        status = job.get('status', 0)
-                        
-                        status_text = "🟢 Активно" if status == 1 else "🔴 Отключено"
-                        print(f"  {status_text} ID: {job_id} - {name}")
-            else:
-                error_msg = result.get('message', 'Неизвестная ошибка')
-                print(f"❌ Ошибка FastCron: {error_msg}")
-        else:
-            print(f"❌ Ошибка HTTP {response.status_code}: {response.text}")
-            
-    except Exception as e:
-        print(f"❌ Исключение при получении списка: {e}")
+    """Показывает все задания FastCron: Floating Island и остальные"""
+    provider_scheduler.list_all_jobs(PROVIDER)
 
 def delete_job(job_id: str):
-    """Удаляет задание FastCron по ID"""
-    if not FASTCRON_API_KEY:
-        print("❌ Не установлена переменная FASTCRON_API_KEY")
-        return False
-    
-    try:
-        response = requests.get(
-            f"{FASTCRON_BASE_URL}/v1/cron_delete",
-            params={
-                'token': FASTCRON_API_KEY,
-                'id': job_id
-            },
-            timeout=30
-        )
-        
-        if response.status_code == 200:
-            result = response.json()
-            if result.get('status') == 'success':
-                print(f"✅ FastCron задание {job_id} удалено успешно")
-                return True
-            else:
-                error_msg = result.get('message', 'Неизвестная ошибка')
-                print(f"❌ Ошибка FastCron: {error_msg}")
-                return False
-        else:
-            print(f"❌ Ошибка HTTP {response.status_code}: {response.text}")
-            return False
-            
-    except Exception as e:
-        print(f"❌ Исключение при удалении задания: {e}")
-        return False
+    """Удаляет задание по ID (и из локального хранилища)"""
+    return provider_scheduler.delete_job_by_id(PROVIDER, job_id)
 
 def main():
     """Основная функция с CLI интерфейсом для FastCron"""
@@ -3,6 +3,7 @@
 
 import os
 import requests
+import http_client
 import json
 from datetime import datetime, timedelta
 import pytz
@@ -82,7 +83,7 @@ def test_fastcron_post_request():
     
     try:
         # Выполняем POST запрос
-        response = requests.post(
+        response = http_client.post(
             f"{FASTCRON_BASE_URL}/v1/cron_add",
             json=payload,
             timeout=30
@@ -130,7 +131,7 @@ def delete_test_job(job_id):
     print(f"\n🗑️ Удаляем тестовое задание {job_id}...")
     
     try:
-        response = requests.post(
+        response = http_client.post(
             f"{FASTCRON_BASE_URL}/v1/cron_delete",
             json={
                 'token': FASTCRON_API_KEY,
@@ -161,7 +162,7 @@ def test_fastcron_list():
     print("=" * 50)
     
     try:
-        response = requests.post(
+        response = http_client.post(
             f"{FASTCRON_BASE_URL}/v1/cron_list",
             json={'token': FASTCRON_API_KEY},
             timeout=30
@@ -8,43 +8,37 @@
 
 import os
 import sys
-from datetime import datetime, timedelta
+from datetime import datetime
 import pytz
 
 # Импортируем функции из основных модулей
 try:
-    from floating_island_bot import calculate_next_events
-    from setup_cronjob import create_single_notification_job, validate_environment
+    from floating_island_bot import iter_events
+    from tz_render import get_renderer
+    from cron_providers import CronJobOrgProvider
 except ImportError as e:
     print(f"❌ Ошибка импорта: {e}")
-    print("💡 Убедитесь, что файлы floating_island_bot.py и setup_cronjob.py находятся в той же папке")
+    print("💡 Убедитесь, что файлы floating_island_bot.py и cron_providers.py находятся в той же папке")
     sys.exit(1)
 
+PROVIDER = CronJobOrgProvider()
+
 def schedule_single_event():
     """Планирует только одно следующее событие"""
-    if not validate_environment():
+    if not PROVIDER.validate_environment():
         return False
     
     now = datetime.now(pytz.UTC)
-    events = calculate_next_events(now, count=1)
-    
-    if not events:
-        print("❌ Не найдено событий для планирования")
-        return False
+    events = iter_events(now)
     
-    event = events[0]
+    event = next(events)
     notification_time = event['notification_time']
     
     # Пропускаем события в прошлом
     if notification_time <= now:
         print("⏭️ Пропускаем событие в прошлом, ищем следующее...")
-        events = calculate_next_events(now + timedelta(minutes=1), count=1)
-        if events:
-            event = events[0]
-            notification_time = event['notification_time']
-        else:
-            print("❌ Не найдено будущих событий")
-            return False
+        event = next(events)
+        notification_time = event['notification_time']
     
     event_start = event['event_start']
     
@@ -61,7 +55,7 @@ def schedule_single_event():
     title = f"Floating Island {notification_time.strftime('%d.%m %H:%M')} UTC"
     
     print(f"\n🚀 Создаем задание...")
-    job_id = create_single_notification_job(notification_time, title)
+    job_id = PROVIDER.create_job(notification_time, title)
     
     if job_id:
         print(f"✅ Событие успешно запланировано!")
@@ -76,22 +70,15 @@ def schedule_single_event():
 def show_next_event():
     """Показывает информацию о следующем событии"""
     now = datetime.now(pytz.UTC)
-    events = calculate_next_events(now, count=1)
-    
-    if not events:
-        print("❌ Не найдено событий")
-        return
-    
-    event = events[0]
+    event = next(iter_events(now))
     notification_time = event['notification_time']
     event_start = event['event_start']
     
-    kiev_tz = pytz.timezone('Europe/Kiev')
-    event_kiev = event_start.astimezone(kiev_tz)
+    event_kiev = get_renderer('Europe/Kiev').format(event_start)
     
     print(f"📅 СЛЕДУЮЩЕЕ СОБЫТИЕ")
     print("=" * 30)
-    print(f"🎈 Floating Island: {event_kiev.strftime('%d.%m.%Y %H:%M')} (Киев)")
+    print(f"🎈 Floating Island: {event_kiev} (Киев)")
     print(f"📢 Уведомление: {notification_time.strftime('%d.%m.%Y %H:%M')} UTC")
     
     time_until = (notification_time - now).total_seconds()
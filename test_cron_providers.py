@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Проверка хеджированного создания заданий (cron_providers.hedged_create)
+Провайдеры подменены: задержки ответа задаются в секундах
+
+Запуск: python test_cron_providers.py
+"""
+
+import threading
+import time
+import unittest
+from datetime import datetime
+
+import pytz
+
+import cron_providers
+
+NOTIFICATION_TIME = datetime(2026, 10, 23, 16, 0, tzinfo=pytz.UTC)
+
+class FakeProvider:
+    """Провайдер, который создает задание через delay секунд"""
+
+    def __init__(self, name: str, delay: float, job_id):
+        self.display_name = name
+        self.delay = delay
+        self.job_id = job_id
+        self.created = []
+        self.deleted = []
+        self._lock = threading.Lock()
+
+    def create_job(self, notification_time, title=None):
+        time.sleep(self.delay)
+        with self._lock:
+            self.created.append(self.job_id)
+        return self.job_id
+
+    def delete_job(self, job_id, title=''):
+        with self._lock:
+            self.deleted.append(job_id)
+        return True
+
+class HedgedCreateTest(unittest.TestCase):
+
+    def test_loser_duplicate_deleted_before_return(self):
+        slow = FakeProvider('slow', 0.6, 'slow-job')
+        fast = FakeProvider('fast', 0.05, 'fast-job')
+        result = cron_providers.hedged_create([slow, fast], NOTIFICATION_TIME, hedge_delay=0.2, deadline=5)
+
+        self.assertIs(result.provider, fast)
+        self.assertEqual(result.job_id, 'fast-job')
+        # Победитель известен через ~0.25 сек, но функция ждет, пока slow удалит дубликат
+        self.assertLess(result.elapsed, 0.5)
+        self.assertEqual(slow.created, ['slow-job'])
+        self.assertEqual(slow.deleted, ['slow-job'])
+        self.assertEqual(fast.deleted, [])
+
+    def test_single_provider_wins(self):
+        only = FakeProvider('only', 0.01, 'job')
+        result = cron_providers.hedged_create([only], NOTIFICATION_TIME, hedge_delay=0.2, deadline=5)
+        self.assertIs(result.provider, only)
+        self.assertEqual(only.deleted, [])
+
+    def test_wait_for_loser_bounded_by_deadline(self):
+        slow = FakeProvider('slow', 3, 'slow-job')
+        fast = FakeProvider('fast', 0.05, 'fast-job')
+        started = time.monotonic()
+        result = cron_providers.hedged_create([slow, fast], NOTIFICATION_TIME, hedge_delay=0.1, deadline=0.5)
+
+        self.assertIs(result.provider, fast)
+        self.assertLess(time.monotonic() - started, 1.5)
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
@@ -1,5 +1,5 @@
 import os
-import requests
+import http_client
 import json
 
 # Get environment variables
@@ -13,7 +13,7 @@ print("🔍 Testing FastCron API connection...")
 
 try:
     # Test the cron_list endpoint
-    response = requests.post(
+    response = http_client.post(
         'https://app.fastcron.com/api/v1/cron_list',
         json={'token': FASTCRON_API_KEY},
         timeout=10
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Проверка планирования следующего уведомления после отправки
+Задание срабатывает раньше события на задержку workflow, поэтому запуск
+начинается до event_start - планироваться должно следующее событие
+
+Запуск: python test_floating_island_bot.py
+"""
+
+import unittest
+from datetime import timedelta
+from unittest import mock
+
+import cron_providers
+import floating_island_bot as bot
+import job_ledger
+
+class ScheduleAfterEarlyRunTest(unittest.TestCase):
+
+    def setUp(self):
+        self.sent = bot.Event(500)
+        # Снимок запуска, взятый за 90 секунд до уведомления (до ожидания event_start)
+        self.snapshot = bot.TimelineSnapshot(now=self.sent.notification_time - timedelta(seconds=90))
+
+    def test_stale_snapshot_still_points_at_sent_event(self):
+        self.assertEqual(self.snapshot.next_event.index, self.sent.index)
+
+    def test_event_after_sent(self):
+        self.assertEqual(bot.get_event_after(self.sent, self.snapshot).index, self.sent.index + 1)
+
+    def test_event_after_skips_past_events(self):
+        late = bot.TimelineSnapshot(now=bot.Event(503).notification_time + timedelta(minutes=1))
+        self.assertEqual(bot.get_event_after(self.sent, late).index, 504)
+
+    def test_single_job_for_next_event(self):
+        provider = mock.Mock(display_name='Fake')
+        result = cron_providers.HedgedResult(provider=provider, job_id=1, elapsed=0.1)
+        with mock.patch.object(bot, 'ROLLING_WINDOW', 0), \
+                mock.patch.object(cron_providers, 'get_configured_providers', return_value=[provider]), \
+                mock.patch.object(cron_providers, 'hedged_create', return_value=result) as hedged_create:
+            self.assertTrue(bot.schedule_next_notification(self.snapshot, sent_event=self.sent))
+
+        notification_time = hedged_create.call_args[0][1]
+        self.assertEqual(notification_time, bot.Event(self.sent.index + 1).notification_time)
+        self.assertGreater(notification_time, self.snapshot.now)
+
+    def test_rolling_window_starts_after_sent_event(self):
+        result = job_ledger.TopUpResult(created=[], deleted=[], failed=[])
+        with mock.patch.object(job_ledger, 'top_up_window', return_value=result) as top_up_window:
+            self.assertTrue(bot.schedule_rolling_window(3, sent_event=self.sent, snapshot=self.snapshot))
+
+        expected = [bot.Event(self.sent.index + offset).notification_time for offset in (1, 2, 3)]
+        self.assertEqual(top_up_window.call_args[0][0], expected)
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
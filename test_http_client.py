@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Проверка потокового разбора списка заданий (http_client.iter_json_array)
+Ответ режется на блоки всех возможных размеров: значение на границе блока
+должно разбираться так же, как целый ответ
+
+Запуск: python test_http_client.py
+"""
+
+import json
+import unittest
+
+import http_client
+
+class FakeResponse:
+    """Ответ с телом, которое отдается блоками по chunk_size символов"""
+
+    def __init__(self, body: str):
+        self.body = body
+        self.encoding = 'utf-8'
+
+    def iter_content(self, chunk_size=1, decode_unicode=False):
+        for start in range(0, len(self.body), chunk_size):
+            yield self.body[start:start + chunk_size]
+
+def parse(body: str, key: str, chunk_size: int) -> list:
+    return list(http_client.iter_json_array(FakeResponse(body), key, chunk_size))
+
+class IterJsonArrayTest(unittest.TestCase):
+
+    def assert_all_chunk_sizes(self, body: str, key: str, expected: list):
+        for chunk_size in range(1, len(body) + 1):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(parse(body, key, chunk_size), expected)
+
+    def test_scalars_split_at_chunk_boundary(self):
+        items = [0.5, 1e5, -12, 3.25e-2, 0, True, False, None, 'строка', 10]
+        body = json.dumps({'status': 'success', 'data': items})
+        self.assert_all_chunk_sizes(body, 'data', items)
+
+    def test_jobs_after_other_fields(self):
+        jobs = [{'jobId': 1, 'title': 'Floating Island 1', 'schedule': {'hours': [16], 'expiresAt': 0}},
+                {'jobId': 20, 'title': 'Notifications Checker', 'enabled': True}]
+        body = json.dumps({'someFailed': False, 'count': 2.0, 'jobs': jobs, 'total': 2}, ensure_ascii=False)
+        self.assert_all_chunk_sizes(body, 'jobs', jobs)
+
+    def test_whitespace_between_values(self):
+        body = '{ "data" : [ 1 ,\n 2.5e1 , "x" \r\n] }'
+        self.assert_all_chunk_sizes(body, 'data', [1, 25.0, 'x'])
+
+    def test_empty_array(self):
+        self.assert_all_chunk_sizes('{"data": []}', 'data', [])
+
+    def test_missing_key(self):
+        with self.assertRaises(ValueError):
+            parse('{"status": "error", "message": "bad token"}', 'data', 4)
+
+    def test_truncated_response(self):
+        for body in ('{"data": [1, 2', '{"data": [1, 0.'):
+            for chunk_size in range(1, len(body) + 1):
+                with self.subTest(body=body, chunk_size=chunk_size):
+                    with self.assertRaises(ValueError):
+                        parse(body, 'data', chunk_size)
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
@@ -2,7 +2,7 @@
 # -*- coding: utf-8 -*-
 
 import os
-import requests
+import http_client
 import json
 from datetime import datetime
 import pytz
@@ -76,7 +76,7 @@ def test_new_webhook_format():
     print(f"📋 Payload: {json.dumps(payload, indent=2, ensure_ascii=False)}")
     
     try:
-        response = requests.post(dispatch_url, headers=headers, json=payload, timeout=15)
+        response = http_client.post(dispatch_url, headers=headers, json=payload, timeout=15)
         
         print(f"\n📊 Результат запроса:")
         print(f"   Статус: {response.status_code}")
@@ -3,7 +3,7 @@
 
 import os
 import sys
-import requests
+import http_client
 import json
 import time
 from datetime import datetime, timedelta
@@ -111,7 +111,7 @@ def send_test_telegram_message():
     
     try:
         print(f"📱 Отправляем тестовое сообщение в чат {TELEGRAM_CHAT_ID}...")
-        response = requests.post(url, json=data, timeout=10)
+        response = http_client.post(url, json=data, timeout=10)
         
         if response.status_code == 200:
             print("✅ Тестовое уведомление отправлено в Telegram!")
@@ -166,7 +166,7 @@ def create_test_github_webhook():
     
     try:
         print("🚀 Отправляем тестовый webhook в GitHub...")
-        response = requests.post(github_dispatch_url, headers=headers, json=test_payload, timeout=10)
+        response = http_client.post(github_dispatch_url, headers=headers, json=test_payload, timeout=10)
         
         if response.status_code == 204:
             print("✅ Тестовый webhook отправлен в GitHub!")
@@ -230,7 +230,7 @@ def create_test_fastcron_job():
     }
     
     try:
-        response = requests.post(
+        response = http_client.post(
             f"{FASTCRON_BASE_URL}/v1/cron_add",
             json=payload,
             timeout=30
@@ -2,7 +2,7 @@
 # -*- coding: utf-8 -*-
 
 import os
-import requests
+import http_client
 import json
 from datetime import datetime
 import pytz
@@ -68,7 +68,7 @@ def test_webhook():
     }
     
     try:
-        response = requests.post(webhook_url, headers=headers, json=payload, timeout=15)
+        response = http_client.post(webhook_url, headers=headers, json=payload, timeout=15)
         
         print(f"Статус ответа: {response.status_code}")
         
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Иерархическое колесо таймеров
+Добавление и отмена таймера - O(1) независимо от числа ожидающих таймеров,
+все таймеры одного тика срабатывают одной пачкой. Дальние таймеры лежат
+на верхних уровнях и опускаются на нижние по мере приближения срока
+"""
+
+import math
+import time
+
+DEFAULT_TICK = 1.0  # Длительность тика, сек
+DEFAULT_WHEEL_SIZE = 64  # Слотов на уровне
+DEFAULT_LEVELS = 4  # Уровней: 64^4 тиков - около 194 суток при тике в секунду
+
+class Timer:
+    """Таймер колеса; payload передается обработчику при срабатывании"""
+    __slots__ = ('deadline', 'tick', 'payload', '_wheel', '_bucket')
+
+    def __init__(self, deadline: float, tick: int, payload, wheel):
+        self.deadline = deadline
+        self.tick = tick
+        self.payload = payload
+        self._wheel = wheel
+        self._bucket = None
+
+    @property
+    def active(self) -> bool:
+        """Таймер ожидает срабатывания (не сработал и не отменен)"""
+        return self._bucket is not None
+
+    def cancel(self) -> bool:
+        """Отменяет таймер за O(1); False, если он уже сработал или отменен"""
+        return self._wheel.cancel(self)
+
+    def __repr__(self):
+        return f"Timer(deadline={self.deadline!r}, payload={self.payload!r})"
+
+class TimingWheel:
+    """Иерархическое колесо таймеров с тиком tick секунд"""
+
+    def __init__(self, tick: float = DEFAULT_TICK, wheel_size: int = DEFAULT_WHEEL_SIZE,
+                 levels: int = DEFAULT_LEVELS, start: float = None):
+        self.tick = tick
+        self.wheel_size = wheel_size
+        self.levels = levels
+        # Сколько тиков покрывает один слот каждого уровня
+        self._spans = [wheel_size ** level for level in range(levels)]
+        # Слот - словарь таймеров: удаление из него за O(1), порядок добавления сохраняется
+        self._slots = [[{} for _ in range(wheel_size)] for _ in range(levels)]
+        self._due = {}  # Таймеры, срок которых уже прошел в момент добавления
+        self._current = self._to_tick(time.time() if start is None else start)
+        self._count = 0
+
+    def _to_tick(self, moment: float) -> int:
+        # Небольшой запас против ошибки округления на границе тика
+        return math.floor(moment / self.tick + 1e-9)
+
+    def __len__(self):
+        return self._count
+
+    def schedule(self, deadline: float, payload=None) -> Timer:
+        """Добавляет таймер на момент deadline (секунды, как time.time())"""
+        # Таймер срабатывает на первой границе тика не раньше deadline
+        timer = Timer(deadline, math.ceil(deadline / self.tick - 1e-9), payload, self)
+        self._insert(timer)
+        self._count += 1
+        return timer
+
+    def cancel(self, timer: Timer) -> bool:
+        """Отменяет таймер за O(1)"""
+        bucket = timer._bucket
+        if bucket is None:
+            return False
+        del bucket[timer]
+        timer._bucket = None
+        self._count -= 1
+        return True
+
+    def _insert(self, timer: Timer):
+        delta = timer.tick - self._current
+        if delta <= 0:
+            # Срок наступил: слот текущего тика уже обработан
+            bucket = self._due
+        else:
+            # Самый нижний уровень, диапазон которого вмещает срок таймера
+            level = 0
+            while level < self.levels - 1 and delta >= self._spans[level] * self.wheel_size:
+                level += 1
+            bucket = self._slots[level][(timer.tick // self._spans[level]) % self.wheel_size]
+        bucket[timer] = None
+        timer._bucket = bucket
+
+    def advance(self, now: float = None) -> list:
+        """
+        Продвигает колесо до момента now и возвращает пачку сработавших таймеров
+        в порядке тиков (внутри тика - в порядке добавления)
+        """
+        target = self._to_tick(time.time() if now is None else now)
+        fired = self._take(self._due)
+
+        while self._current < target:
+            if self._count == len(fired):
+                # Ожидающих таймеров нет - перескакиваем сразу к цели
+                self._current = target
+                break
+
+            self._current += 1
+
+            # Сверху вниз переносим таймеры слота, чей интервал начинается в этом тике
+            # (интервалы верхних уровней начинаются только на оборотах нижнего)
+            if self._current % self.wheel_size == 0:
+                for level in range(self.levels - 1, 0, -1):
+                    span = self._spans[level]
+                    if self._current % span == 0:
+                        bucket = self._slots[level][(self._current // span) % self.wheel_size]
+                        if bucket:
+                            for timer in self._take(bucket):
+                                self._insert(timer)
+
+            bucket = self._slots[0][self._current % self.wheel_size]
+            if bucket:
+                for timer in self._take(bucket):
+                    if timer.tick <= self._current:
+                        fired.append(timer)
+                    else:
+                        # Дальше одного оборота (колесо из одного уровня) - ждет следующего
+                        self._insert(timer)
+            if self._due:
+                # Таймеры, спустившиеся с верхних уровней ровно на этот тик
+                fired.extend(self._take(self._due))
+
+        self._count -= len(fired)
+        return fired
+
+    @staticmethod
+    def _take(bucket: dict) -> list:
+        timers = list(bucket)
+        bucket.clear()
+        for timer in timers:
+            timer._bucket = None
+        return timers
+
+    def next_due(self) -> float:
+        """
+        Момент (секунды), не позже которого нужно вызвать advance: срабатывание
+        ближайшего таймера или None. Просматривает первый непустой слот каждого уровня
+        """
+        if self._due:
+            return self._current * self.tick
+        if not self._count:
+            return None
+
+        earliest = None
+        for level in range(self.levels):
+            span = self._spans[level]
+            first = self._current // span + 1
+            for offset in range(self.wheel_size):
+                bucket = self._slots[level][(first + offset) % self.wheel_size]
+                if bucket:
+                    tick = min(timer.tick for timer in bucket)
+                    if level == self.levels - 1:
+                        # На верхнем уровне могут лежать таймеры дальше одного оборота,
+                        # поэтому не позже переноса этого слота на нижние уровни
+                        tick = min(tick, (first + offset) * span)
+                    if earliest is None or tick < earliest:
+                        earliest = tick
+                    break
+        return earliest * self.tick
\ No newline at end of file
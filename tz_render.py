@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Быстрый перевод времени событий в местное время
+Таблица переходов на летнее/зимнее время строится один раз на горизонт
+расписания, дальше смещение находится бинарным поиском по таблице
+"""
+
+from bisect import bisect_right
+from datetime import datetime, timedelta
+import pytz
+
+DEFAULT_TIMEZONE = 'Europe/Kiev'
+DEFAULT_HORIZON = timedelta(days=730)  # Горизонт таблицы переходов - 2 года
+
+class LocalTimeRenderer:
+    """Переводит UTC-время в местное время указанного IANA часового пояса"""
+
+    def __init__(self, zone: str = DEFAULT_TIMEZONE, start: datetime = None, end: datetime = None):
+        self.zone = zone
+        self.tz = pytz.timezone(zone)
+
+        start = start or datetime.now(pytz.UTC) - timedelta(days=1)
+        end = end or start + DEFAULT_HORIZON
+        # Границы горизонта и таблица переходов хранятся в наивном UTC, как в pytz
+        self.start = _to_naive_utc(start)
+        self.end = _to_naive_utc(end)
+
+        transition_times = getattr(self.tz, '_utc_transition_times', None)
+        if not transition_times:
+            # Пояс без переходов (UTC, Etc/GMT+3 и т.п.) - одно постоянное смещение
+            self._transitions = [datetime.min]
+            self._offsets = [self.tz.utcoffset(self.start)]
+            return
+
+        # Оставляем переход, действующий на начало горизонта, и все переходы внутри него
+        first = max(bisect_right(transition_times, self.start) - 1, 0)
+        last = bisect_right(transition_times, self.end)
+        self._transitions = transition_times[first:last]
+        self._offsets = [info[0] for info in self.tz._transition_info[first:last]]
+
+    def to_local(self, moment: datetime) -> datetime:
+        """Возвращает местное время (без tzinfo) для момента moment с часовым поясом"""
+        utc = _to_naive_utc(moment)
+
+        if not self.start <= utc <= self.end:
+            # Вне горизонта таблицы - полная нормализация через pytz
+            return moment.astimezone(self.tz).replace(tzinfo=None)
+
+        index = bisect_right(self._transitions, utc) - 1
+        return utc + self._offsets[index]
+
+    def format(self, moment: datetime, fmt: str = '%d.%m.%Y %H:%M') -> str:
+        """Форматирует момент moment как строку местного времени"""
+        return self.to_local(moment).strftime(fmt)
+
+def _to_naive_utc(moment: datetime) -> datetime:
+    """Переводит время с часовым поясом в наивное UTC-время"""
+    return moment.replace(tzinfo=None) - moment.utcoffset()
+
+_renderers = {}
+
+def get_renderer(zone: str = DEFAULT_TIMEZONE) -> LocalTimeRenderer:
+    """Возвращает общий для процесса LocalTimeRenderer для часового пояса zone"""
+    renderer = _renderers.get(zone)
+    if renderer is None:
+        renderer = _renderers[zone] = LocalTimeRenderer(zone)
+    return renderer
\ No newline at end of file